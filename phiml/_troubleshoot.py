@@ -1,11 +1,47 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
+from importlib.util import find_spec
 from os.path import dirname
 
-import packaging.version
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')  # only errors. TensorFlow reads this during import, so it must be set before any check imports it.
+
+
+_MIN_CFG_OK = False  # set once assert_minimal_config() has passed
+_IN_PROCESS_LOCK = threading.Lock()  # serializes framework checks that could not be moved to a separate process
+_RESULT_MARKER = '__phiml_troubleshoot_result__'  # precedes the result in the output of a check process
+_CHECK_TIMEOUT = 300  # seconds before a framework check process is abandoned, e.g. when GPU initialization hangs
+_GPU_CACHE = {}  # Backend name -> list of GPU devices. Device enumeration is expensive and does not change while the process is running.
+
+
+def _list_gpus(backend) -> list:
+    if backend.name not in _GPU_CACHE:
+        _GPU_CACHE[backend.name] = backend.list_devices('GPU')
+    return _GPU_CACHE[backend.name]
+
+
+def _version_tuple(version: str) -> tuple:
+    """ Parses the numeric release part of a version string, e.g. `'0.4.23.dev1'` -> `(0, 4, 23)`. """
+    return tuple(int(p) for p in re.match(r'\d+(\.\d+)*', version).group(0).split('.'))
+
+
+def _find_installation(*modules: str) -> str:
+    specs = [find_spec(m) for m in modules]
+    if any(spec is None for spec in specs):
+        return "Not installed."
+    locations = ", ".join(f"{m} at {dirname(spec.origin)}" for m, spec in zip(modules, specs))
+    return f"Installed ({locations}), not checked."
 
 
 def assert_minimal_config():  # raises AssertionError
-    import sys
+    global _MIN_CFG_OK
+    if _MIN_CFG_OK:
+        return
     assert sys.version_info.major == 3 and sys.version_info.minor >= 6, "Φ-ML requires Python 3.6 or newer to run"
 
     try:
@@ -18,22 +54,124 @@ def assert_minimal_config():  # raises AssertionError
         raise AssertionError("Φ-ML is unable to run because SciPy is not installed.")
     from . import math
     with math.NUMPY:
-        a = math.ones()
-        math.assert_close(a + a, 2)
+        _assert_addition_works()
+    _MIN_CFG_OK = True
 
 
-def troubleshoot():
-    from . import __version__
-    return f"Φ-ML {__version__} at {dirname(__file__)}\n"\
-           f"PyTorch: {troubleshoot_torch()}\n"\
-           f"Jax: {troubleshoot_jax()}\n"\
-           f"TensorFlow: {troubleshoot_tensorflow()}\n"  # TF last so avoid VRAM issues
+def _assert_addition_works():
+    """ Runs a minimal computation with the current default backend. """
+    from . import math
+    one = math.ones()
+    math.assert_close(one + one, 2)
 
 
-def troubleshoot_tensorflow():
-    from . import math
-    import os
-    os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'  # only errors
+@lru_cache(maxsize=1)
+def troubleshoot() -> 'TroubleshootReport':
+    """
+    Checks the installation of Φ-ML and the optional machine learning frameworks.
+    Each framework is checked in a separate process so that a broken installation of one framework cannot affect the others.
+    The results are cached. To re-run the checks, e.g. after installing a framework, call `cache_clear()` on this function and on `troubleshoot_torch`, `troubleshoot_jax`, `troubleshoot_tensorflow`.
+
+    Returns:
+        `TroubleshootReport`. Frameworks are only checked when the corresponding attribute is accessed.
+            Converting the report to a `str` runs all remaining checks concurrently and formats a human-readable summary.
+    """
+    return TroubleshootReport()
+
+
+class TroubleshootReport:
+    """
+    Installation report of Φ-ML and the optional machine learning frameworks, see `troubleshoot()`.
+    """
+
+    def __init__(self):
+        from . import __version__
+        self.phiml_version: str = __version__
+        self.location: str = dirname(__file__)
+        self._results = {}  # framework -> status, filled on first access
+
+    def _result(self, framework: str, *modules: str) -> str:
+        if framework not in self._results:
+            self._results[framework] = _troubleshoot_isolated(framework, *modules)
+        return self._results[framework]
+
+    @property
+    def torch(self) -> str:
+        """ Status of the PyTorch installation. """
+        return self._result('torch', 'torch')
+
+    @property
+    def jax(self) -> str:
+        """ Status of the Jax installation. """
+        return self._result('jax', 'jax', 'jaxlib')
+
+    @property
+    def tensorflow(self) -> str:
+        """ Status of the TensorFlow installation. """
+        return self._result('tensorflow', 'tensorflow')
+
+    def __str__(self):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            torch_, jax_, tf = executor.map(lambda name: getattr(self, name), ('torch', 'jax', 'tensorflow'))
+        return f"Φ-ML {self.phiml_version} at {self.location}\n"\
+               f"PyTorch: {torch_}\n"\
+               f"Jax: {jax_}\n"\
+               f"TensorFlow: {tf}\n"
+
+    def __repr__(self):
+        return str(self)
+
+
+def _troubleshoot_isolated(framework: str, *modules: str) -> str:
+    """
+    Runs `troubleshoot_<framework>()` in a separate Python process.
+    The process only imports Φ-ML, not the caller's main module, so scripts without a `__main__` guard are not re-executed.
+    Falls back to running the check in this process if no process can be started.
+    In-process checks are run one at a time since importing multiple frameworks concurrently can deadlock.
+
+    Args:
+        framework: Suffix of the troubleshoot function.
+        *modules: Modules that must be installed for the check to be meaningful.
+
+    Returns:
+        Result of `troubleshoot_<framework>()`.
+    """
+    if any(find_spec(m) is None for m in modules):
+        return "Not installed."
+    code = f"import json; from phiml._troubleshoot import troubleshoot_{framework}; print({_RESULT_MARKER!r} + json.dumps(troubleshoot_{framework}()))"
+    env = dict(os.environ, PYTHONIOENCODING='utf-8')
+    env['PYTHONPATH'] = os.pathsep.join([p for p in [env.get('PYTHONPATH'), dirname(dirname(__file__))] if p])  # fall back to this Φ-ML installation after the user's paths
+    try:
+        process = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, timeout=_CHECK_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        return f"Installed but the check timed out after {_CHECK_TIMEOUT} seconds."
+    except OSError:
+        with _IN_PROCESS_LOCK:
+            return globals()[f'troubleshoot_{framework}']()
+    stdout = process.stdout.decode('utf-8', errors='replace')
+    if _RESULT_MARKER not in stdout:
+        stderr_lines = process.stderr.decode('utf-8', errors='replace').strip().splitlines()
+        cause = f": {stderr_lines[-1].strip()}" if stderr_lines else "."
+        return f"Installed but the check crashed with exit code {process.returncode}{cause}"
+    return json.loads(stdout.rsplit(_RESULT_MARKER, 1)[1])
+
+
+@lru_cache(maxsize=None)
+def troubleshoot_tensorflow(deep=True):
+    """
+    Checks the TensorFlow installation.
+
+    Args:
+        deep: If `False`, only checks whether TensorFlow is installed without importing it.
+
+    Returns:
+        Human-readable status as `str`.
+    """
+    if not deep:
+        return _find_installation('tensorflow')
+    if find_spec('tensorflow') is None:
+        return "Not installed."
     try:
         import tensorflow
     except ImportError:
@@ -48,32 +186,47 @@ def troubleshoot_tensorflow():
     except BaseException as err:
         return f"Installed ({tf_version}) but not available due to internal error: {err}"
     try:
-        gpu_count = len(tf.TENSORFLOW.list_devices('GPU'))
+        gpu_count = len(_list_gpus(tf.TENSORFLOW))
     except BaseException as err:
         return f"Installed ({tf_version}) but device initialization failed with error: {err}"
     with tf.TENSORFLOW:
         try:
-            math.assert_close(math.ones() + math.ones(), 2)
+            _assert_addition_works()
             # TODO cuDNN math.convolve(math.ones(batch=8, x=64), math.ones(x=4))
         except BaseException as err:
             return f"Installed ({tf_version}) but tests failed with error: {err}"
     if gpu_count == 0:
         return f"Installed ({tf_version}), {gpu_count} GPUs available."
     else:
-        from .backend.tensorflow._tf_cuda_resample import librariesLoaded
-        if librariesLoaded:
-            cuda_str = 'CUDA kernels available.'
-        else:
-            import platform
-            if platform.system().lower() != 'linux':
-                cuda_str = f"Optional TensorFlow CUDA kernels not available and compilation not recommended on {platform.system()}. GPU will be used nevertheless."
-            else:
-                cuda_str = f"Optional TensorFlow CUDA kernels not available. GPU will be used nevertheless. Clone the Φ-ML source from GitHub and run 'python setup.py tf_cuda' to compile them. See https://tum-pbs.github.io/PhiML/Installation_Instructions.html"
-        return f"Installed ({tf_version}), {gpu_count} GPUs available.\n{cuda_str}"
-
-
-def troubleshoot_torch():
-    from . import math
+        return f"Installed ({tf_version}), {gpu_count} GPUs available.\n{_tf_cuda_kernels_status()}"
+
+
+@lru_cache(maxsize=1)
+def _tf_cuda_kernels_status() -> str:
+    import platform
+    if platform.system().lower() != 'linux':  # kernels are only compiled on Linux, skip loading the library
+        return f"Optional TensorFlow CUDA kernels not available and compilation not recommended on {platform.system()}. GPU will be used nevertheless."
+    from .backend.tensorflow._tf_cuda_resample import librariesLoaded
+    if librariesLoaded:
+        return 'CUDA kernels available.'
+    return f"Optional TensorFlow CUDA kernels not available. GPU will be used nevertheless. Clone the Φ-ML source from GitHub and run 'python setup.py tf_cuda' to compile them. See https://tum-pbs.github.io/PhiML/Installation_Instructions.html"
+
+
+@lru_cache(maxsize=None)
+def troubleshoot_torch(deep=True):
+    """
+    Checks the PyTorch installation.
+
+    Args:
+        deep: If `False`, only checks whether PyTorch is installed without importing it.
+
+    Returns:
+        Human-readable status as `str`.
+    """
+    if not deep:
+        return _find_installation('torch')
+    if find_spec('torch') is None:
+        return "Not installed."
     try:
         import torch
     except ImportError:
@@ -84,12 +237,12 @@ def troubleshoot_torch():
     except BaseException as err:
         return f"Installed ({torch_version}) but not available due to internal error: {err}"
     try:
-        gpu_count = len(torch_.TORCH.list_devices('GPU'))
+        gpu_count = len(_list_gpus(torch_.TORCH))
     except BaseException as err:
         return f"Installed ({torch_version}) but device initialization failed with error: {err}"
     with torch_.TORCH:
         try:
-            math.assert_close(math.ones() + math.ones(), 2)
+            _assert_addition_works()
         except BaseException as err:
             return f"Installed ({torch_version}) but tests failed with error: {err}"
     if torch_version.startswith('1.10.'):
@@ -99,8 +252,21 @@ def troubleshoot_torch():
     return f"Installed ({torch_version}), {gpu_count} GPUs available."
 
 
-def troubleshoot_jax():
-    from . import math
+@lru_cache(maxsize=None)
+def troubleshoot_jax(deep=True):
+    """
+    Checks the Jax installation.
+
+    Args:
+        deep: If `False`, only checks whether Jax is installed without importing it.
+
+    Returns:
+        Human-readable status as `str`.
+    """
+    if not deep:
+        return _find_installation('jax', 'jaxlib')
+    if find_spec('jax') is None or find_spec('jaxlib') is None:
+        return "Not installed."
     try:
         import jax
         import jaxlib
@@ -112,76 +278,108 @@ def troubleshoot_jax():
     except BaseException as err:
         return f"Installed ({version}) but not available due to internal error: {err}"
     try:
-        gpu_count = len(jax_.JAX.list_devices('GPU'))
+        gpu_count = len(_list_gpus(jax_.JAX))
     except BaseException as err:
         return f"Installed ({version}) but device initialization failed with error: {err}"
     with jax_.JAX:
         try:
-            math.assert_close(math.ones() + math.ones(), 2)
+            _assert_addition_works()
         except BaseException as err:
             return f"Installed ({version}) but tests failed with error: {err}"
-    if packaging.version.parse(jax.__version__) < packaging.version.parse('0.2.20'):
+    if _version_tuple(jax.__version__) < (0, 2, 20):
         return f"Installed ({version}), {gpu_count} GPUs available. This is an old version of Jax that may not support all required features, e.g. sparse matrices."
     return f"Installed ({version}), {gpu_count} GPUs available."
 
 
 @contextmanager
-def plot_solves():
+def plot_solves(filename: str = None):
     """
     While `plot_solves()` is active, certain performance optimizations and algorithm implementations may be disabled.
+
+    Args:
+        filename: Optional file to save the convergence plot to. If `None`, the plot is only shown.
     """
     from . import math
-    import pylab
-    cycle = pylab.rcParams['axes.prop_cycle'].by_key()['color']
+    import numpy
+    import matplotlib.pyplot as plt
+    cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
     with math.SolveTape(record_trajectories=True) as solves:
         try:
             yield solves
         finally:
+            fig, ax = plt.subplots()
+            curves_mse, curves_max, curves_mse_max, colors, labels = [], [], [], [], []
             for i, result in enumerate(solves):
                 assert isinstance(result, math.SolveInfo)
                 from .math._tensors import disassemble_tree
                 _, (residual,) = disassemble_tree(result.residual)
-                residual_mse = math.mean(math.sqrt(math.sum(residual ** 2)), residual.shape.without('trajectory'))
-                residual_mse_max = math.max(math.sqrt(math.sum(residual ** 2)), residual.shape.without('trajectory'))
-                # residual_mean = math.mean(math.abs(residual), residual.shape.without('trajectory'))
-                residual_max = math.max(math.abs(residual), residual.shape.without('trajectory'))
-                pylab.plot(residual_mse.numpy(), label=f"{i}: {result.method}", color=cycle[i % len(cycle)])
-                pylab.plot(residual_max.numpy(), '--', alpha=0.2, color=cycle[i % len(cycle)])
-                pylab.plot(residual_mse_max.numpy(), alpha=0.2, color=cycle[i % len(cycle)])
+                residual_sq = residual ** 2
+                residual_norm = math.sqrt(math.sum(residual_sq))
+                reduce_dims = residual.shape.without('trajectory')
+                residual_mse = math.mean(residual_norm, reduce_dims)
+                residual_mse_max = math.max(residual_norm, reduce_dims)
+                # residual_mean = math.mean(math.abs(residual), reduce_dims)
+                residual_max = math.sqrt(math.max(residual_sq, reduce_dims))  # max |x| = sqrt(max x²)
+                curves = residual_mse, residual_max, residual_mse_max
+                math.choose_backend(*curves).block_until_ready([c.native() for c in curves])  # single sync before transferring all curves
+                for curve_list, c in zip((curves_mse, curves_max, curves_mse_max), curves):
+                    curve_list.append(numpy.reshape(c.numpy(), -1))
+                colors.append(cycle[i % len(cycle)])
+                labels.append(f"{i}: {result.method}")
+                converged, diverged, iterations, function_evaluations = [v.trajectory[-1] for v in (result.converged, result.diverged, result.iterations, result.function_evaluations)]
                 print(f"Solve {i}: {result.method} ({1000 * result.solve_time:.1f} ms)\n"
                       f"\t{result.solve}\n"
                       f"\t{result.msg}\n"
-                      f"\tConverged: {result.converged.trajectory[-1]}\n"
-                      f"\tDiverged: {result.diverged.trajectory[-1]}\n"
-                      f"\tIterations: {result.iterations.trajectory[-1]}\n"
-                      f"\tFunction evaulations: {result.function_evaluations.trajectory[-1]}")
-            pylab.yscale('log')
-            pylab.ylabel("Residual: MSE / max / individual max")
-            pylab.xlabel("Iteration")
-            pylab.title(f"Solve Convergence")
-            pylab.legend(loc='upper right')
-            pylab.savefig(f"pressure-solvers-FP32.png")
-            pylab.show()
+                      f"\tConverged: {converged}\n"
+                      f"\tDiverged: {diverged}\n"
+                      f"\tIterations: {iterations}\n"
+                      f"\tFunction evaulations: {function_evaluations}")
+            if solves:  # one plot call per curve type, trajectories of different length are padded with NaN
+                length = max(len(c) for c in curves_mse)
+                def as_columns(curve_list):
+                    return numpy.stack([numpy.pad(c.astype(float), (0, length - len(c)), constant_values=numpy.nan) for c in curve_list], axis=1)
+                ax.set_prop_cycle(color=colors)
+                ax.plot(as_columns(curves_mse), label=labels)
+                ax.set_prop_cycle(color=colors)
+                ax.plot(as_columns(curves_max), '--', alpha=0.2, rasterized=True)  # auxiliary curves don't need to be vector graphics
+                ax.set_prop_cycle(color=colors)
+                ax.plot(as_columns(curves_mse_max), alpha=0.2, rasterized=True)
+            ax.set_yscale('log')
+            ax.set_ylabel("Residual: MSE / max / individual max")
+            ax.set_xlabel("Iteration")
+            ax.set_title(f"Solve Convergence")
+            ax.legend(loc='upper right')
+            if filename is not None:
+                fig.savefig(filename)
+            plt.show()
 
 
 def count_tensors_in_memory(min_print_size: int = None):
-    import sys
     import gc
+    import numpy as np
     from .math import Tensor
 
     gc.collect()
-    total = 0
-    bytes = 0
-    for obj in gc.get_objects():
-        try:
-            if isinstance(obj, Tensor):
-                total += 1
-                size = obj.shape.volume * obj.dtype.itemsize
-                bytes += size
-                if isinstance(min_print_size, int) and size >= min_print_size:
-                    print(f"Tensor '{obj}' ({sys.getrefcount(obj)} references)")
-                    # referrers = gc.get_referrers(obj)
-                    # print([type(r) for r in referrers])
-        except Exception:
-            pass
-    print(f"There are {total} Φ-ML Tensors with a total size of {bytes / 1024 / 1024:.1f} MB")
+    tensors = [obj for obj in gc.get_objects() if _is_tensor(obj, Tensor)]
+    sizes = np.fromiter((_tensor_bytes(t) for t in tensors), dtype=np.int64, count=len(tensors))
+    if isinstance(min_print_size, int):
+        for i in np.flatnonzero(sizes >= min_print_size):
+            print(f"Tensor '{tensors[i]}' ({sys.getrefcount(tensors[i])} references)")
+            # referrers = gc.get_referrers(obj)
+            # print([type(r) for r in referrers])
+    print(f"There are {len(tensors)} Φ-ML Tensors with a total size of {int(sizes.sum()) / 1024 / 1024:.1f} MB")
+
+
+def _is_tensor(obj, tensor_type) -> bool:
+    try:
+        return isinstance(obj, tensor_type)
+    except ReferenceError:  # weakref proxies whose referent was collected fail on __class__ access
+        return False
+
+
+def _tensor_bytes(t) -> int:
+    volume = t.shape.volume  # None for shapes with undefined sizes
+    bits = t.dtype.bits  # None for object types
+    if volume is None or bits is None:
+        return 0
+    return volume * t.dtype.itemsize
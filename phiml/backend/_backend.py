@@ -1534,6 +1534,14 @@ class Backend:
         x, y = self.auto_cast(x, y)
         return x >= y
 
+    def less_than(self, x, y):
+        x, y = self.auto_cast(x, y)
+        return x < y
+
+    def less_or_equal(self, x, y):
+        x, y = self.auto_cast(x, y)
+        return x <= y
+
     def add(self, a, b):
         a, b = self.auto_cast(a, b, bool_to_int=True)
         return a + b
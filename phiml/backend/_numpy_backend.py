@@ -36,7 +36,6 @@ class NumPyBackend(Backend):
     maximum = np.maximum
     ones_like = staticmethod(np.ones_like)
     zeros_like = staticmethod(np.zeros_like)
-    reshape = staticmethod(np.reshape)
     concat = staticmethod(np.concatenate)
     stack = staticmethod(np.stack)
     tile = staticmethod(np.tile)
@@ -456,6 +455,13 @@ class NumPyBackend(Backend):
     #             return grads
     #     return gradient
 
+    def reshape(self, value, shape):
+        if isinstance(value, np.ndarray) and not value.flags.c_contiguous:
+            contiguous = _tiled_transpose_copy(value, shape)
+            if contiguous is not None:
+                value = contiguous
+        return np.reshape(value, shape)
+
     def linear_solve(self, method: str, lin, y, x0, rtol, atol, max_iter, pre) -> SolveResult:
         if method in ['direct', 'CG-native', 'GMres', 'biCG', 'biCG-stab', 'CGS', 'lGMres', 'minres', 'QMR', 'GCrotMK'] and max_iter.shape[0] == 1:
             from ._linalg import scipy_spsolve
@@ -482,3 +488,63 @@ class NumPyBackend(Backend):
 
     def solve_triangular_sparse(self, matrix, rhs, lower: bool, unit_diagonal: bool):  # needs to be overridden to indicate this is natively implemented
         return spsolve_triangular(matrix, rhs.T, lower=lower, unit_diagonal=unit_diagonal).T
+
+
+def _tiled_transpose_copy(arr: np.ndarray, shape, tile=64) -> Optional[np.ndarray]:
+    """
+    Copies a transposed view into C-contiguous memory tile by tile.
+    The naive strided copy of a large transposed array whose row stride is a power of two suffers from cache conflict misses.
+
+    Args:
+        arr: Array that is an axis permutation of a C-contiguous buffer, such as the result of `np.transpose`.
+        shape: Target shape of the following reshape. Nothing is copied if the reshape does not require a copy.
+        tile: Edge length of the copied tiles.
+
+    Returns:
+        C-contiguous copy of `arr` or `None` if `arr` is not a transposed view of two large blocks with a power-of-two stride.
+    """
+    if arr.size < 2 ** 16:
+        return None
+    axes = [i for i in range(arr.ndim) if arr.shape[i] != 1]
+    mem_order = sorted(axes, key=lambda i: -arr.strides[i])
+    stride = arr.itemsize
+    for i in reversed(mem_order):
+        if arr.strides[i] != stride:
+            return None  # not a permutation of a contiguous buffer
+        stride *= arr.shape[i]
+    # --- merge axes that are adjacent in memory into groups (view order) ---
+    groups = []  # (size, memory position of first axis)
+    prev_pos = None
+    for i in axes:
+        pos = mem_order.index(i)
+        if prev_pos is not None and pos == prev_pos + 1:
+            groups[-1] = (groups[-1][0] * arr.shape[i], groups[-1][1])
+        else:
+            groups.append((arr.shape[i], pos))
+        prev_pos = pos
+    perm = [sorted(g[1] for g in groups).index(g[1]) for g in groups]
+    swapped = [i for i, p in enumerate(perm) if p != i]
+    if len(swapped) != 2 or swapped[1] != swapped[0] + 1:
+        return None  # only a single swap of adjacent blocks, e.g. [1,0] or [0,2,1,3]
+    a, b = swapped
+    outer = int(np.prod([g[0] for g in groups[:a]]))
+    inner = int(np.prod([g[0] for g in groups[b + 1:]]))
+    x, y = groups[a][0], groups[b][0]
+    row_bytes = x * arr.itemsize  # memory stride of the y block
+    if inner != 1 or x < 128 or y < 128 or row_bytes < 512 or row_bytes & (row_bytes - 1):
+        return None  # contiguous inner chunks or non-power-of-two strides are copied efficiently by NumPy
+    # --- skip if the reshape can be performed as a view ---
+    shape = tuple(shape)
+    if -1 in shape:
+        known = int(np.prod([s for s in shape if s != -1]))
+        shape = tuple(arr.size // known if s == -1 else s for s in shape)
+    cuts = set(np.cumprod(shape).tolist())
+    if all(c in cuts for c in np.cumprod([g[0] for g in groups])[:-1].tolist()):
+        return None
+    # --- tiled copy ---
+    src = np.reshape(arr, (outer, x, y, inner))  # view since all groups are contiguous
+    out = np.empty((outer, x, y, inner), arr.dtype)
+    for i in range(0, x, tile):
+        for j in range(0, y, tile):
+            out[:, i:i+tile, j:j+tile] = src[:, i:i+tile, j:j+tile]
+    return out.reshape(arr.shape)
@@ -736,6 +736,16 @@ class TFBackend(Backend):
             x, y = self.auto_cast(x, y)
             return x >= y
 
+    def less_than(self, x, y):
+        with self._device_for(x, y):
+            x, y = self.auto_cast(x, y)
+            return x < y
+
+    def less_or_equal(self, x, y):
+        with self._device_for(x, y):
+            x, y = self.auto_cast(x, y)
+            return x <= y
+
     def add(self, a, b):
         with self._device_for(a, b):
             if isinstance(a, tf.SparseTensor) or isinstance(b, tf.SparseTensor):
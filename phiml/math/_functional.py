@@ -828,16 +828,16 @@ Traces can be avoided by jit-compiling the code that calls custom gradient funct
                 return list(incomplete._natives())
         elif isinstance(tree, (tuple, list)):
             if incomplete is None:
-                return sum([CustomGradientFunction.incomplete_tree_to_natives(None, item, complete_shapes) for item in tree], [])
+                return [n for item in tree for n in CustomGradientFunction.incomplete_tree_to_natives(None, item, complete_shapes)]
             else:
                 assert type(tree) == type(incomplete) and len(tree) == len(incomplete)
-                return sum([CustomGradientFunction.incomplete_tree_to_natives(i_item, c_item, complete_shapes) for i_item, c_item in zip(incomplete, tree)], [])
+                return [n for i_item, c_item in zip(incomplete, tree) for n in CustomGradientFunction.incomplete_tree_to_natives(i_item, c_item, complete_shapes)]
         elif isinstance(tree, dict):
             if incomplete is None:
-                return sum([CustomGradientFunction.incomplete_tree_to_natives(None, item, complete_shapes) for item in tree.values()], [])
+                return [n for item in tree.values() for n in CustomGradientFunction.incomplete_tree_to_natives(None, item, complete_shapes)]
             else:
                 assert type(tree) == type(incomplete) and len(tree) == len(incomplete) and set(tree.keys()) == set(incomplete.keys())
-                return sum([CustomGradientFunction.incomplete_tree_to_natives(incomplete[key], c_item, complete_shapes) for key, c_item in tree.items()], [])
+                return [n for key, c_item in tree.items() for n in CustomGradientFunction.incomplete_tree_to_natives(incomplete[key], c_item, complete_shapes)]
         elif isinstance(tree, PhiTreeNode):
             attributes = variable_attributes(tree)
             natives = []
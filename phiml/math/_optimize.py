@@ -1,7 +1,7 @@
 import time
 import uuid
 import warnings
-from typing import Callable, Generic, List, TypeVar, Any, Tuple, Union, Optional
+from typing import Callable, Generic, List, TypeVar, Any, Tuple, Union, Optional, Dict
 
 import numpy
 import numpy as np
@@ -136,6 +136,8 @@ class SolveInfo(Generic[X, Y]):
     When representing the full optimization trajectory, all tracked quantities will have an additional `trajectory` batch dimension.
     """
 
+    __slots__ = ('solve', 'x', 'residual', 'iterations', 'function_evaluations', 'converged', 'diverged', 'method', 'msg', 'solve_time')
+
     def __init__(self,
                  solve: Solve,
                  x: X,
@@ -324,6 +326,24 @@ class SolveTape:
     def __len__(self):
         return len(self.solves)
 
+    def as_columns(self) -> Dict[str, Any]:
+        """
+        Returns the recorded results grouped by property instead of by solve.
+        Tensor-valued properties, such as `iterations` or `residual`, are stacked along a new batch dimension `solve`.
+        Properties that are `None` for any recorded solve, as well as `solve`, `method`, `msg` and `solve_time`, are returned as `list`s.
+
+        Returns:
+            `dict` mapping `SolveInfo` property names to the stacked values.
+        """
+        columns = {}
+        for name in SolveInfo.__slots__:
+            values = [getattr(info, name) for info in self.solves]
+            if name in ('solve', 'method', 'msg', 'solve_time') or not values or any(v is None for v in values):
+                columns[name] = values
+            else:
+                columns[name] = stack(values, batch('solve'))
+        return columns
+
 
 _SOLVE_TAPES: List[SolveTape] = []
 
@@ -1,5 +1,6 @@
 import re
 import warnings
+from functools import lru_cache
 from numbers import Number
 from typing import Tuple, Callable, List, Union, Any, Sequence, Optional, Dict
 
@@ -129,7 +130,7 @@ class Shape:
             dims = parse_dim_order(item)
             return all(dim in self.names for dim in dims)
         elif isinstance(item, Shape):
-            return all([d in self.names for d in item.names])
+            return all(d in self.names for d in item.names)
         else:
             raise ValueError(item)
 
@@ -157,9 +158,10 @@ class Shape:
         if dim is None:
             return None
         elif isinstance(dim, str):
-            if dim not in self.names:
-                raise ValueError(f"Shape {self} has no dimension '{dim}'")
-            return self.names.index(dim)
+            try:
+                return self.names.index(dim)  # single scan, no separate membership test
+            except ValueError:
+                raise ValueError(f"Shape {self} has no dimension '{dim}'") from None
         elif isinstance(dim, Shape):
             assert dim.rank == 1, f"index() requires a single dimension as input but got {dim}. Use indices() for multiple dimensions."
             return self.names.index(dim.name)
@@ -633,6 +635,8 @@ class Shape:
         return '(' + ', '.join(strings) + ')'
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Shape):
             return False
         if self.names != other.names or self.types != other.types:
@@ -1070,10 +1074,18 @@ class Shape:
         """
         Returns the total number of values contained in a tensor of this shape.
         This is the product of all dimension sizes.
+        The result is computed once per `Shape` and cached.
 
         Returns:
             volume as `int` or `Tensor` or `None` if the shape is not `Shape.well_defined`
         """
+        try:
+            return self._volume
+        except AttributeError:
+            self._volume = self._compute_volume()
+            return self._volume
+
+    def _compute_volume(self) -> Union[int, None]:
         from . import Tensor
         for dim, size in self._named_sizes:
             if isinstance(size, Tensor) and size.rank > 0:
@@ -1092,6 +1104,11 @@ class Shape:
         """ True if this shape has no dimensions. Equivalent to `Shape.rank` `== 0`. """
         return len(self.sizes) == 0
 
+    @property
+    def is_scalar(self) -> bool:
+        """ True if a tensor of this shape holds exactly one value, i.e. it has no dimensions or `Shape.volume` `== 1`. """
+        return not self.names or self.volume == 1
+
     def after_pad(self, widths: dict) -> 'Shape':
         sizes = list(self.sizes)
         item_names = list(self.item_names)
@@ -1123,7 +1140,7 @@ class Shape:
             selection = item_names.index(selection)
         if isinstance(selection, (tuple, list)):
             selection = list(selection)
-            if any([isinstance(s, str) for s in selection]):
+            if any(isinstance(s, str) for s in selection):
                 item_names = self.get_item_names(dim, fallback_spatial=True)
                 for i, s in enumerate(selection):
                     if isinstance(s, str):
@@ -1183,7 +1200,7 @@ class Shape:
                 if self.get_item_names(sel_dim) is not None:
                     result = result._with_item_name(sel_dim, tuple(self.get_item_names(sel_dim)[selection]))
             elif isinstance(selection, (tuple, list)):
-                result = result._replace_single_size(sel_dim, len(selection))
+                result = result._replace_single_size(sel_dim, len(selection), keep_item_names=True)
                 if self.get_item_names(sel_dim) is not None:
                     result = result._with_item_name(sel_dim, tuple([self.get_item_names(sel_dim)[i] for i in selection]))
             else:
@@ -1324,12 +1341,18 @@ def parse_dim_order(order: Union[str, tuple, list, Shape, None], check_rank: int
     elif isinstance(order, tuple):
         return order
     elif isinstance(order, str):
-        parts = order.split(',')
-        parts = [p.strip() for p in parts if p]
-        return tuple(parts)
+        return _split_dim_order(order)
     raise ValueError(order)
 
 
+@lru_cache(maxsize=256)
+def _split_dim_order(order: str) -> tuple:
+    """ Splits a comma-separated dim order. Cached since the same order strings are passed repeatedly, e.g. to `Tensor.native()`. """
+    parts = order.split(',')
+    parts = [p.strip() for p in parts if p]
+    return tuple(parts)
+
+
 def _construct_shape(dim_type: str, *args, **dims):
     sizes = ()
     names = []
@@ -1700,6 +1723,17 @@ def auto(spec: Union[str, Shape], default_type=None) -> Shape:
 
 
 DIM_FUNCTIONS = {BATCH_DIM: batch, SPATIAL_DIM: spatial, INSTANCE_DIM: instance, CHANNEL_DIM: channel, DUAL_DIM: dual}
+_DIM_TYPES = {f: t for t, f in DIM_FUNCTIONS.items()}
+
+
+def _is_grouped_by_type(shape: Shape, order: tuple) -> bool:
+    """ Whether the dims of `shape` are already sorted by type according to `order`, i.e. `merge_shapes(shape, order=order)` would return `shape` unchanged. """
+    try:
+        rank = {_DIM_TYPES[f]: i for i, f in enumerate(order)}
+    except KeyError:
+        return False
+    type_ranks = [rank.get(t, -1) for t in shape.types]
+    return -1 not in type_ranks and all(r1 <= r2 for r1, r2 in zip(type_ranks, type_ranks[1:]))
 
 
 def merge_shapes(*objs: Union[Shape, Any], order=(batch, dual, instance, spatial, channel), allow_varying_sizes=False):
@@ -1725,6 +1759,8 @@ def merge_shapes(*objs: Union[Shape, Any], order=(batch, dual, instance, spatial
     if not objs:
         return EMPTY_SHAPE
     shapes = [obj if isinstance(obj, Shape) else shape(obj) for obj in objs]
+    if all(sh is shapes[0] or sh == shapes[0] for sh in shapes[1:]) and _is_grouped_by_type(shapes[0], order):
+        return shapes[0]  # fast path for equal shapes, nothing to merge or check
     merged = []
     for dim_type in order:
         type_group = dim_type(shapes[0])
@@ -1965,7 +2001,7 @@ def shape_stack(stack_dim: Shape, *shapes: Shape):
             size = len(shapes)
         else:
             dim_sizes = [(shape.get_size(name) if name in shape else 1) for shape in shapes]
-            if all([math.close(s, dim_sizes[0]) for s in dim_sizes[1:]]):
+            if all(math.close(s, dim_sizes[0]) for s in dim_sizes[1:]):
                 size = dim_sizes[0]
             else:
                 from ._magic_ops import stack
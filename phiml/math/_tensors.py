@@ -1,10 +1,14 @@
 import numbers
+import operator
+import threading
 import warnings
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice, repeat
 from typing import Union, TypeVar
 
-from dataclasses import dataclass
-from typing import Tuple, Callable, List
+from dataclasses import dataclass, field
+from typing import Tuple, Callable, List, Optional, Any
 
 import numpy
 import numpy as np
@@ -21,6 +25,18 @@ from .magic import BoundDim, PhiTreeNode, slicing_dict
 from .magic import Shapable
 
 
+_OPS_MODULE = None
+
+
+def _ops():
+    """ Returns the `_ops` module, imported on first use since it depends on this module. """
+    global _OPS_MODULE
+    if _OPS_MODULE is None:
+        from . import _ops as ops_module
+        _OPS_MODULE = ops_module
+    return _OPS_MODULE
+
+
 class Tensor:
     """
     Abstract base class to represent structured data of one data type.
@@ -40,6 +56,8 @@ class Tensor:
     When backed by an editable native tensor, e.g. a `numpy.ndarray`, do not edit the underlying data structure.
     """
 
+    __slots__ = ('__weakref__',)  # subclasses may declare __slots__ but Tensors remain weakly referenceable
+
     def native(self, order: Union[str, tuple, list, Shape] = None, singleton_for_const=False):
         """
         Returns a native tensor object with the dimensions ordered according to `order`.
@@ -94,96 +112,31 @@ class Tensor:
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):  # NumPy interface
         if len(inputs) != 2:
             return NotImplemented
-        if ufunc.__name__ == 'multiply':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x * y, lambda x, y: choose_backend(x, y).mul(x, y), 'mul', '*')
-            else:
-                return self._op2(inputs[0], lambda x, y: y * x, lambda x, y: choose_backend(x, y).mul(y, x), 'rmul', '*')
-        if ufunc.__name__ == 'add':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x + y, lambda x, y: choose_backend(x, y).add(x, y), 'add', '+')
-            else:
-                return self._op2(inputs[0], lambda x, y: y + x, lambda x, y: choose_backend(x, y).add(y, x), 'radd', '+')
-        if ufunc.__name__ == 'subtract':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x - y, lambda x, y: choose_backend(x, y).sub(x, y), 'add', '-')
-            else:
-                return self._op2(inputs[0], lambda x, y: y - x, lambda x, y: choose_backend(x, y).sub(y, x), 'rsub', '-')
-        if ufunc.__name__ in ['divide', 'true_divide']:
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x / y, lambda x, y: choose_backend(x, y).div(x, y), 'true_divide', '/')
-            else:
-                return self._op2(inputs[0], lambda x, y: y / x, lambda x, y: choose_backend(x, y).div(y, x), 'r_true_divide', '/')
-        if ufunc.__name__ == 'floor_divide':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x // y, lambda x, y: choose_backend(x, y).floordiv(x, y), 'floor_divide', '//')
-            else:
-                return self._op2(inputs[0], lambda x, y: y // x, lambda x, y: choose_backend(x, y).floordiv(y, x), 'r_floor_divide', '//')
-        if ufunc.__name__ == 'remainder':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x % y, lambda x, y: choose_backend(x, y).mod(x, y), 'remainder', '%')
-            else:
-                return self._op2(inputs[0], lambda x, y: y % x, lambda x, y: choose_backend(x, y).mod(y, x), 'r_remainder', '%')
-        if ufunc.__name__ == 'power':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x ** y, lambda x, y: choose_backend(x, y).pow(x, y), 'power', '**')
-            else:
-                return self._op2(inputs[0], lambda x, y: y ** x, lambda x, y: choose_backend(x, y).pow(y, x), 'r_power', '**')
+        mode = _EQUALITY_REDUCE.mode
         if ufunc.__name__ == 'equal':
-            if _EQUALITY_REDUCE[-1] == 'ref':
+            if mode == 'ref':
                 return wrap(inputs[0] is inputs[1])
-            elif _EQUALITY_REDUCE[-1] == 'shape_and_value':
-                if set(inputs[0].shape) != set(inputs[1].shape):
+            elif mode == 'shape_and_value':
+                if not _same_dims(inputs[0].shape, inputs[1].shape):
                     return wrap(False)
                 from ._ops import close
                 return wrap(close(inputs[0], inputs[1], rel_tolerance=0, abs_tolerance=0))
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x == y, lambda x, y: choose_backend(x, y).equal(x, y), 'equal', '==')
-            else:
-                return self._op2(inputs[0], lambda x, y: y == x, lambda x, y: choose_backend(x, y).equal(y, x), 'r_equal', '==')
-        if ufunc.__name__ == 'not_equal':
-            if _EQUALITY_REDUCE[-1] == 'ref':
+        elif ufunc.__name__ == 'not_equal':
+            if mode == 'ref':
                 return wrap(inputs[0] is not inputs[1])
-            elif _EQUALITY_REDUCE[-1] == 'shape_and_value':
-                if set(inputs[0].shape) != set(inputs[1].shape):
+            elif mode == 'shape_and_value':
+                if not _same_dims(inputs[0].shape, inputs[1].shape):
                     return wrap(True)
                 from ._ops import close
                 return wrap(not close(inputs[0], inputs[1], rel_tolerance=0, abs_tolerance=0))
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x != y, lambda x, y: choose_backend(x, y).not_equal(x, y), 'equal', '!=')
-            else:
-                return self._op2(inputs[0], lambda x, y: y != x, lambda x, y: choose_backend(x, y).not_equal(y, x), 'r_equal', '!=')
-        if ufunc.__name__ == 'greater':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x > y, lambda x, y: choose_backend(x, y).greater_than(x, y), 'greater', '>')
-            else:
-                return self._op2(inputs[0], lambda x, y: y > x, lambda x, y: choose_backend(x, y).greater_than(y, x), 'r_greater', '>')
-        if ufunc.__name__ == 'greater_equal':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x >= y, lambda x, y: choose_backend(x, y).greater_or_equal(x, y), 'greater_equal', '>=')
-            else:
-                return self._op2(inputs[0], lambda x, y: y >= x, lambda x, y: choose_backend(x, y).greater_or_equal(y, x), 'r_greater_equal', '>=')
-        if ufunc.__name__ == 'less':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x < y, lambda x, y: choose_backend(x, y).greater_than(y, x), 'less', '<')
-            else:
-                return self._op2(inputs[0], lambda x, y: y < x, lambda x, y: choose_backend(x, y).greater_than(x, y), 'r_less', '<')
-        if ufunc.__name__ == 'less_equal':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x <= y, lambda x, y: choose_backend(x, y).greater_or_equal(y, x), 'less_equal', '<=')
-            else:
-                return self._op2(inputs[0], lambda x, y: y <= x, lambda x, y: choose_backend(x, y).greater_or_equal(x, y), 'r_less_equal', '<=')
-        if ufunc.__name__ == 'left_shift':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x << y, lambda x, y: choose_backend(x, y).shift_bits_left(x, y), 'left_shift', '<<')
-            else:
-                return self._op2(inputs[0], lambda x, y: y << x, lambda x, y: choose_backend(x, y).shift_bits_left(y, x), 'r_left_shift', '<<')
-        if ufunc.__name__ == 'right_shift':
-            if inputs[0] is self:
-                return self._op2(inputs[1], lambda x, y: x >> y, lambda x, y: choose_backend(x, y).shift_bits_right(x, y), 'right_shift', '>>')
-            else:
-                return self._op2(inputs[0], lambda x, y: y >> x, lambda x, y: choose_backend(x, y).shift_bits_right(y, x), 'r_right_shift', '>>')
-        raise NotImplementedError(f"NumPy function '{ufunc.__name__}' is not compatible with Φ-ML tensors.")
+        ops = _UFUNC_OPS.get(ufunc.__name__, None)
+        if ops is None:
+            raise NotImplementedError(f"NumPy function '{ufunc.__name__}' is not compatible with Φ-ML tensors.")
+        forward, reverse = ops
+        if inputs[0] is self:
+            return self._op2(inputs[1], *forward)
+        else:
+            return self._op2(inputs[0], *reverse)
 
     @property
     def dtype(self) -> DType:
@@ -248,74 +201,71 @@ class Tensor:
     @property
     def all(self):
         """ Whether all values of this `Tensor` are `True` as a native bool. """
-        from ._ops import all_, cast
         if self.rank == 0:
-            return cast(self, DType(bool)).native()
+            return _ops().cast(self, DType(bool)).native()
         else:
-            return all_(self, dim=self.shape).native()
+            return _ops().all_(self, dim=self.shape).native()
 
     @property
     def any(self):
         """ Whether this `Tensor` contains a `True` value as a native bool. """
-        from ._ops import any_, cast
         if self.rank == 0:
-            return cast(self, DType(bool)).native()
+            return _ops().cast(self, DType(bool)).native()
         else:
-            return any_(self, dim=self.shape).native()
+            return _ops().any_(self, dim=self.shape).native()
 
     @property
     def mean(self):
         """ Mean value of this `Tensor` as a native scalar. """
-        from ._ops import mean
-        return mean(self, dim=self.shape).native()
+        if self.rank == 0 and self.dtype.kind in (float, complex):
+            return self.native()
+        return _ops().mean(self, dim=self.shape).native()
 
     @property
     def finite_mean(self):
         """ Mean value of all finite values in this `Tensor` as a native scalar. """
-        from ._ops import finite_mean
-        return finite_mean(self, dim=self.shape).native()
+        return _ops().finite_mean(self, dim=self.shape).native()
 
     @property
     def std(self):
         """ Standard deviation of this `Tensor` as a native scalar. """
-        from ._ops import std
-        return std(self, dim=self.shape).native()
+        return _ops().std(self, dim=self.shape).native()
 
     @property
     def sum(self):
         """ Sum of all values of this `Tensor` as a native scalar. """
-        from ._ops import sum_
-        return sum_(self, dim=self.shape).native()
+        if self.rank == 0 and self.dtype.kind in (float, complex):
+            return self.native()
+        return _ops().sum_(self, dim=self.shape).native()
 
     @property
     def finite_sum(self):
         """ Sum of all finite values of this `Tensor` as a native scalar. """
-        from ._ops import finite_sum
-        return finite_sum(self, dim=self.shape).native()
+        return _ops().finite_sum(self, dim=self.shape).native()
 
     @property
     def min(self):
         """ Minimum value of this `Tensor` as a native scalar. """
-        from ._ops import min_
-        return min_(self, dim=self.shape).native()
+        if self.rank == 0:
+            return self.native()
+        return _ops().min_(self, dim=self.shape).native()
 
     @property
     def finite_min(self):
         """ Minimum finite value of this `Tensor` as a native scalar. """
-        from ._ops import finite_min
-        return finite_min(self, dim=self.shape).native()
+        return _ops().finite_min(self, dim=self.shape).native()
 
     @property
     def max(self):
         """ Maximum value of this `Tensor` as a native scalar. """
-        from ._ops import max_
-        return max_(self, dim=self.shape).native()
+        if self.rank == 0:
+            return self.native()
+        return _ops().max_(self, dim=self.shape).native()
 
     @property
     def finite_max(self):
         """ Maximum finite value of this `Tensor` as a native scalar. """
-        from ._ops import finite_max
-        return finite_max(self, dim=self.shape).native()
+        return _ops().finite_max(self, dim=self.shape).native()
 
     @property
     def real(self) -> 'Tensor':
@@ -352,9 +302,7 @@ class Tensor:
         """
         if self._is_tracer:
             return False
-        natives = self._natives()
-        natives_available = [choose_backend(native).is_available(native) for native in natives]
-        return all(natives_available)
+        return all(choose_backend(native).is_available(native) for native in self._natives())
 
     @property
     def device(self) -> Union[ComputeDevice, None]:
@@ -371,16 +319,16 @@ class Tensor:
         return self.default_backend.get_device(natives[0])
 
     def __int__(self):
-        return int(self.native()) if self.shape.volume == 1 else NotImplemented
+        return int(self.native()) if self.shape.is_scalar else NotImplemented
 
     def __float__(self):
-        return float(self.native()) if self.shape.volume == 1 else NotImplemented
+        return float(self.native()) if self.shape.is_scalar else NotImplemented
 
     def __complex__(self):
-        return complex(self.native()) if self.shape.volume == 1 else NotImplemented
+        return complex(self.native()) if self.shape.is_scalar else NotImplemented
 
     def __index__(self):
-        assert self.shape.volume == 1, f"Only scalar tensors can be converted to index but has shape {self.shape}"
+        assert self.shape.is_scalar, f"Only scalar tensors can be converted to index but has shape {self.shape}"
         assert self.dtype.kind == int, f"Only int tensors can be converted to index but dtype is {self.dtype}"
         return int(self.native())
 
@@ -393,24 +341,24 @@ class Tensor:
     def __format__(self, format_spec: str):
         if BROADCAST_FORMATTER.values is not None:
             return BROADCAST_FORMATTER.register_formatted(self, format_spec)
-        specs = format_spec.split(':')
+        if not format_spec:
+            return format_tensor(self, PrintOptions())
         layout_ = 'auto'
-        for possible_layout in ['summary', 'full', 'row', 'numpy']:
-            if possible_layout in specs:
-                assert layout_ == 'auto', f"Two layout identifiers encountered in '{format_spec}'"
-                layout_ = possible_layout
-        include_shape = 'shape' in specs or (False if 'no-shape' in specs else None)
-        include_dtype = 'dtype' in specs or (False if 'no-dtype' in specs else None)
-        color = 'color' in specs or (False if 'no-color' in specs else None)
+        flags = {}
         threshold = 8
         float_format = None
-        for spec in specs:
-            if spec.startswith('threshold='):
+        for spec in format_spec.split(':'):
+            if spec in _FORMAT_LAYOUTS:
+                assert layout_ == 'auto', f"Two layout identifiers encountered in '{format_spec}'"
+                layout_ = spec
+            elif spec in _FORMAT_FLAGS:
+                option, value = _FORMAT_FLAGS[spec]
+                flags[option] = value or flags.get(option, False)  # enabling takes precedence over disabling
+            elif spec.startswith('threshold='):
                 threshold = int(spec[len('threshold='):])
             elif '.' in spec:
                 float_format = spec
-        result = format_tensor(self, PrintOptions(layout_, float_format, threshold, color, include_shape, include_dtype))
-        return result
+        return format_tensor(self, PrintOptions(layout_, float_format, threshold, **flags))
 
     def __getitem__(self, item) -> 'Tensor':
         if isinstance(item, Tensor):
@@ -422,6 +370,12 @@ class Tensor:
                 return gather(self, item)
             else:
                 raise AssertionError(f"Index tensor must be of dtype int (gather) or bool (boolean_mask) but got {item}")
+        # Fast path: plain int / slice selections along existing dims need no parsing
+        if isinstance(item, dict):
+            if item and all(isinstance(k, str) and k in self.shape and isinstance(v, (int, slice)) for k, v in item.items()):
+                return self._getitem(item)
+        elif isinstance(item, (int, slice)) and self.shape.rank == 1 and not self.shape.batch:
+            return self._getitem({self.shape.name: item})
         item = slicing_dict(self, item)
         selections = {}
         sliced = self
@@ -430,7 +384,9 @@ class Tensor:
                 continue
             selection = self.shape.prepare_gather(dim, selection)
             # Either handle slicing directly or add it to the dict
-            if isinstance(selection, (tuple, list)):
+            if isinstance(selection, (tuple, list)) and selection and isinstance(sliced, NativeTensor) and all(isinstance(i, int) for i in selection):
+                sliced = sliced._gather_list(dim, selection)
+            elif isinstance(selection, (tuple, list)):
                 from ._magic_ops import stack
                 result = [sliced[{dim: i}] for i in selection]
                 stack_dim = sliced.shape[dim].after_gather({dim: selection})
@@ -526,11 +482,11 @@ class Tensor:
         order = self.shape._order_group(dims)
         if self.shape.is_uniform:
             native = self.native(order)
-            if pos is None:
-                pos = min(self.shape.indices(dims))
-            new_shape = self.shape.without(dims)._expand(packed_dim.with_sizes([self.shape.only(dims).volume]), pos)
-            native = choose_backend(native).reshape(native, new_shape.sizes)
-            return NativeTensor(native, new_shape)
+            packed_dim = packed_dim.with_sizes([self.shape.only(dims).volume])
+            native_shape = self.shape.without(dims)._expand(packed_dim, min(self.shape.indices(dims)))  # dims are grouped where the first one was
+            native = choose_backend(native).reshape(native, native_shape.sizes)
+            new_shape = native_shape if pos is None else self.shape.without(dims)._expand(packed_dim, pos)
+            return NativeTensor(native, native_shape, new_shape)
         else:
             from ._ops import concat_tensor
             from ._magic_ops import pack_dims
@@ -584,125 +540,127 @@ class Tensor:
         return TensorDim(self, name)
 
     def __add__(self, other):
-        return self._op2(other, lambda x, y: x + y, lambda x, y: choose_backend(x, y).add(x, y), 'add', '+')
+        return self._op2(other, *_ADD_OPS)
 
     def __radd__(self, other):
-        return self._op2(other, lambda x, y: y + x, lambda x, y: choose_backend(x, y).add(y, x), 'radd', '+')
+        return self._op2(other, *_RADD_OPS)
 
     def __sub__(self, other):
-        return self._op2(other, lambda x, y: x - y, lambda x, y: choose_backend(x, y).sub(x, y), 'sub', '-')
+        return self._op2(other, *_SUB_OPS)
 
     def __rsub__(self, other):
-        return self._op2(other, lambda x, y: y - x, lambda x, y: choose_backend(x, y).sub(y, x), 'rsub', '-')
+        return self._op2(other, *_RSUB_OPS)
 
     def __and__(self, other):
-        return self._op2(other, lambda x, y: x & y, lambda x, y: choose_backend(x, y).and_(x, y), 'and', '&')
+        return self._op2(other, *_AND_OPS)
 
     def __rand__(self, other):
-        return self._op2(other, lambda x, y: y & x, lambda x, y: choose_backend(x, y).and_(y, x), 'rand', '&')
+        return self._op2(other, *_RAND_OPS)
 
     def __or__(self, other):
-        return self._op2(other, lambda x, y: x | y, lambda x, y: choose_backend(x, y).or_(x, y), 'or', '|')
+        return self._op2(other, *_OR_OPS)
 
     def __ror__(self, other):
-        return self._op2(other, lambda x, y: y | x, lambda x, y: choose_backend(x, y).or_(y, x), 'ror', '|')
+        return self._op2(other, *_ROR_OPS)
 
     def __xor__(self, other):
-        return self._op2(other, lambda x, y: x ^ y, lambda x, y: choose_backend(x, y).xor(x, y), 'xor', '^')
+        return self._op2(other, *_XOR_OPS)
 
     def __rxor__(self, other):
-        return self._op2(other, lambda x, y: y ^ x, lambda x, y: choose_backend(x, y).xor(y, x), 'rxor', '^')
+        return self._op2(other, *_RXOR_OPS)
 
     def __mul__(self, other):
-        return self._op2(other, lambda x, y: x * y, lambda x, y: choose_backend(x, y).mul(x, y), 'mul', '*')
+        return self._op2(other, *_MUL_OPS)
 
     def __rmul__(self, other):
-        return self._op2(other, lambda x, y: y * x, lambda x, y: choose_backend(x, y).mul(y, x), 'rmul', '*')
+        return self._op2(other, *_RMUL_OPS)
 
     def __truediv__(self, other):
-        return self._op2(other, lambda x, y: x / y, lambda x, y: choose_backend(x, y).div(x, y), 'truediv', '/')
+        return self._op2(other, *_TRUEDIV_OPS)
 
     def __rtruediv__(self, other):
-        return self._op2(other, lambda x, y: y / x, lambda x, y: choose_backend(x, y).div(y, x), 'rtruediv', '/')
+        return self._op2(other, *_RTRUEDIV_OPS)
 
     def __divmod__(self, other):
-        return self._op2(other, lambda x, y: divmod(x, y), lambda x, y: divmod(x, y), 'divmod', 'divmod')
+        return self._op2(other, *_DIVMOD_OPS)
 
     def __rdivmod__(self, other):
-        return self._op2(other, lambda x, y: divmod(y, x), lambda x, y: divmod(y, x), 'rdivmod', 'divmod')
+        return self._op2(other, *_RDIVMOD_OPS)
 
     def __floordiv__(self, other):
-        return self._op2(other, lambda x, y: x // y, lambda x, y: choose_backend(x, y).floordiv(x, y), 'floordiv', '//')
+        return self._op2(other, *_FLOORDIV_OPS)
 
     def __rfloordiv__(self, other):
-        return self._op2(other, lambda x, y: y // x, lambda x, y: choose_backend(x, y).floordiv(y, x), 'rfloordiv', '//')
+        return self._op2(other, *_RFLOORDIV_OPS)
 
     def __pow__(self, power, modulo=None):
         assert modulo is None
-        return self._op2(power, lambda x, y: x ** y, lambda x, y: choose_backend(x, y).pow(x, y), 'pow', '**')
+        return self._op2(power, *_POW_OPS)
 
     def __rpow__(self, other):
-        return self._op2(other, lambda x, y: y ** x, lambda x, y: choose_backend(x, y).pow(y, x), 'rpow', '**')
+        return self._op2(other, *_RPOW_OPS)
 
     def __mod__(self, other):
-        return self._op2(other, lambda x, y: x % y, lambda x, y: choose_backend(x, y).mod(x, y), 'mod', '%')
+        return self._op2(other, *_MOD_OPS)
 
     def __rmod__(self, other):
-        return self._op2(other, lambda x, y: y % x, lambda x, y: choose_backend(x, y).mod(y, x), 'rmod', '%')
+        return self._op2(other, *_RMOD_OPS)
 
     def __eq__(self, other):
-        if _EQUALITY_REDUCE[-1] == 'ref':
+        mode = _EQUALITY_REDUCE.mode
+        if mode == 'ref':
             return wrap(self is other)
-        elif _EQUALITY_REDUCE[-1] == 'shape_and_value':
-            if set(self.shape) != set(other.shape):
+        elif mode == 'shape_and_value':
+            if not _same_dims(self.shape, other.shape):
                 return wrap(False)
             from ._ops import close
             return wrap(close(self, other, rel_tolerance=0, abs_tolerance=0))
         if other is None:
             other = float('nan')
-        return self._op2(other, lambda x, y: x == y, lambda x, y: choose_backend(x, y).equal(x, y), 'eq', '==')
+        return self._op2(other, *_EQ_OPS)
 
     def __ne__(self, other):
-        if _EQUALITY_REDUCE[-1] == 'ref':
+        mode = _EQUALITY_REDUCE.mode
+        if mode == 'ref':
             return wrap(self is not other)
-        elif _EQUALITY_REDUCE[-1] == 'shape_and_value':
-            if set(self.shape) != set(other.shape):
+        elif mode == 'shape_and_value':
+            if not _same_dims(self.shape, other.shape):
                 return wrap(True)
             from ._ops import close
             return wrap(not close(self, other, rel_tolerance=0, abs_tolerance=0))
         if other is None:
             other = float('nan')
-        return self._op2(other, lambda x, y: x != y, lambda x, y: choose_backend(x, y).not_equal(x, y), 'ne', '!=')
+        return self._op2(other, *_NE_OPS)
 
     def __lt__(self, other):
-        return self._op2(other, lambda x, y: x < y, lambda x, y: choose_backend(x, y).greater_than(y, x), 'lt', '<')
+        return self._op2(other, *_LT_OPS)
 
     def __le__(self, other):
-        return self._op2(other, lambda x, y: x <= y, lambda x, y: choose_backend(x, y).greater_or_equal(y, x), 'le', '<=')
+        return self._op2(other, *_LE_OPS)
 
     def __gt__(self, other):
-        return self._op2(other, lambda x, y: x > y, lambda x, y: choose_backend(x, y).greater_than(x, y), 'gt', '>')
+        return self._op2(other, *_GT_OPS)
 
     def __ge__(self, other):
-        return self._op2(other, lambda x, y: x >= y, lambda x, y: choose_backend(x, y).greater_or_equal(x, y), 'ge', '>=')
+        return self._op2(other, *_GE_OPS)
 
     def __lshift__(self, other):
-        return self._op2(other, lambda x, y: x << y, lambda x, y: choose_backend(x, y).shift_bits_left(x, y), 'lshift', '<<')
+        return self._op2(other, *_LSHIFT_OPS)
 
     def __rlshift__(self, other):
-        return self._op2(other, lambda y, x: x << y, lambda y, x: choose_backend(x, y).shift_bits_left(x, y), 'lshift', '<<')
+        return self._op2(other, *_RLSHIFT_OPS)
 
     def __rshift__(self, other):
-        return self._op2(other, lambda x, y: x >> y, lambda x, y: choose_backend(x, y).shift_bits_right(x, y), 'rshift', '>>')
+        return self._op2(other, *_RSHIFT_OPS)
 
     def __rrshift__(self, other):
-        return self._op2(other, lambda y, x: x >> y, lambda y, x: choose_backend(x, y).shift_bits_right(x, y), 'rshift', '>>')
+        return self._op2(other, *_RRSHIFT_OPS)
 
     def __abs__(self):
-        return self._op1(lambda t: choose_backend(t).abs(t))
+        return self._op1(_native_abs)
 
     def __round__(self, n=None):
-        return self._op1(lambda t: choose_backend(t).round(t))
+        return self._op1(_native_round)
 
     def __copy__(self):
         return self._op1(lambda t: choose_backend(t).copy(t, only_mutable=True))
@@ -711,10 +669,10 @@ class Tensor:
         return self._op1(lambda t: choose_backend(t).copy(t, only_mutable=False))
 
     def __neg__(self):
-        return self._op1(lambda t: -t)
+        return self._op1(operator.neg)
 
     def __invert__(self):
-        return self._op1(lambda t: ~t)
+        return self._op1(operator.invert)
 
     def __reversed__(self):
         assert self.shape.channel.rank == 1
@@ -732,15 +690,9 @@ class Tensor:
 
     def __matmul__(self, other):
         assert isinstance(other, Tensor), f"Matmul '@' requires two Tensor arguments but got {type(other)}"
-        match_names = self.shape.dual.as_batch().names
-        if not match_names:  # this is not a matrix
-            assert self.shape.primal.only(other.shape).is_empty, f"Cannot compute matmul {self.shape} @ {other.shape}. First argument is not a matrix; it has no dual dimensions."
+        match_dual, match_primal = _matmul_dims(self.shape, other.shape)
+        if match_dual is None:  # this is not a matrix
             return self * other
-        match_primal = other.shape.only(match_names, reorder=True)
-        if not match_primal:
-            assert non_batch(other).non_dual.rank == 1, f"Cannot multiply {self.shape} @ {other.shape} because arg2 does not have appropriate non-dual dimensions"
-            match_primal = non_batch(other).non_dual
-        match_dual = self.shape.dual.only(match_primal.as_dual(), reorder=True)
         left_arg = pack_dims(self, match_dual, dual('_reduce'))
         right_arg = pack_dims(other, match_primal, channel('_reduce'))
         from ._ops import dot
@@ -814,6 +766,140 @@ class Tensor:
         return self
 
 
+# Arguments for Tensor._op2(): (operator, native_function, op_name, op_symbol). Shared by the Python operators and __array_ufunc__.
+_ADD_OPS = (operator.add, lambda x, y: choose_backend(x, y).add(x, y), 'add', '+')
+_RADD_OPS = (lambda x, y: y + x, lambda x, y: choose_backend(x, y).add(y, x), 'radd', '+')
+_SUB_OPS = (operator.sub, lambda x, y: choose_backend(x, y).sub(x, y), 'sub', '-')
+_RSUB_OPS = (lambda x, y: y - x, lambda x, y: choose_backend(x, y).sub(y, x), 'rsub', '-')
+_AND_OPS = (operator.and_, lambda x, y: choose_backend(x, y).and_(x, y), 'and', '&')
+_RAND_OPS = (lambda x, y: y & x, lambda x, y: choose_backend(x, y).and_(y, x), 'rand', '&')
+_OR_OPS = (operator.or_, lambda x, y: choose_backend(x, y).or_(x, y), 'or', '|')
+_ROR_OPS = (lambda x, y: y | x, lambda x, y: choose_backend(x, y).or_(y, x), 'ror', '|')
+_XOR_OPS = (operator.xor, lambda x, y: choose_backend(x, y).xor(x, y), 'xor', '^')
+_RXOR_OPS = (lambda x, y: y ^ x, lambda x, y: choose_backend(x, y).xor(y, x), 'rxor', '^')
+_MUL_OPS = (operator.mul, lambda x, y: choose_backend(x, y).mul(x, y), 'mul', '*')
+_RMUL_OPS = (lambda x, y: y * x, lambda x, y: choose_backend(x, y).mul(y, x), 'rmul', '*')
+_TRUEDIV_OPS = (operator.truediv, lambda x, y: choose_backend(x, y).div(x, y), 'truediv', '/')
+_RTRUEDIV_OPS = (lambda x, y: y / x, lambda x, y: choose_backend(x, y).div(y, x), 'rtruediv', '/')
+_FLOORDIV_OPS = (operator.floordiv, lambda x, y: choose_backend(x, y).floordiv(x, y), 'floordiv', '//')
+_RFLOORDIV_OPS = (lambda x, y: y // x, lambda x, y: choose_backend(x, y).floordiv(y, x), 'rfloordiv', '//')
+_POW_OPS = (operator.pow, lambda x, y: choose_backend(x, y).pow(x, y), 'pow', '**')
+_RPOW_OPS = (lambda x, y: y ** x, lambda x, y: choose_backend(x, y).pow(y, x), 'rpow', '**')
+_MOD_OPS = (operator.mod, lambda x, y: choose_backend(x, y).mod(x, y), 'mod', '%')
+_RMOD_OPS = (lambda x, y: y % x, lambda x, y: choose_backend(x, y).mod(y, x), 'rmod', '%')
+_EQ_OPS = (operator.eq, lambda x, y: choose_backend(x, y).equal(x, y), 'eq', '==')
+_NE_OPS = (operator.ne, lambda x, y: choose_backend(x, y).not_equal(x, y), 'ne', '!=')
+_LSHIFT_OPS = (operator.lshift, lambda x, y: choose_backend(x, y).shift_bits_left(x, y), 'lshift', '<<')
+_RLSHIFT_OPS = (lambda x, y: y << x, lambda x, y: choose_backend(x, y).shift_bits_left(y, x), 'rlshift', '<<')
+_RSHIFT_OPS = (operator.rshift, lambda x, y: choose_backend(x, y).shift_bits_right(x, y), 'rshift', '>>')
+_RRSHIFT_OPS = (lambda x, y: y >> x, lambda x, y: choose_backend(x, y).shift_bits_right(y, x), 'rrshift', '>>')
+_LT_OPS = (operator.lt, lambda x, y: choose_backend(x, y).less_than(x, y), 'lt', '<')
+_LE_OPS = (operator.le, lambda x, y: choose_backend(x, y).less_or_equal(x, y), 'le', '<=')
+_GT_OPS = (operator.gt, lambda x, y: choose_backend(x, y).greater_than(x, y), 'gt', '>')
+_GE_OPS = (operator.ge, lambda x, y: choose_backend(x, y).greater_or_equal(x, y), 'ge', '>=')
+_RLT_OPS = (lambda x, y: y < x, lambda x, y: choose_backend(x, y).greater_than(x, y), 'rlt', '<')
+_RLE_OPS = (lambda x, y: y <= x, lambda x, y: choose_backend(x, y).greater_or_equal(x, y), 'rle', '<=')
+_RGT_OPS = (lambda x, y: y > x, lambda x, y: choose_backend(x, y).less_than(x, y), 'rgt', '>')
+_RGE_OPS = (lambda x, y: y >= x, lambda x, y: choose_backend(x, y).less_or_equal(x, y), 'rge', '>=')
+_REQ_OPS = (lambda x, y: y == x, lambda x, y: choose_backend(x, y).equal(y, x), 'req', '==')
+_RNE_OPS = (lambda x, y: y != x, lambda x, y: choose_backend(x, y).not_equal(y, x), 'rne', '!=')
+_DIVMOD_OPS = (divmod, divmod, 'divmod', 'divmod')
+_RDIVMOD_OPS = (lambda x, y: divmod(y, x), lambda x, y: divmod(y, x), 'rdivmod', 'divmod')
+
+_BACKEND_OP2 = {  # op_name -> (Backend method, whether the native function swaps its arguments), must match the native functions above
+    'add': ('add', False), 'radd': ('add', True),
+    'sub': ('sub', False), 'rsub': ('sub', True),
+    'and': ('and_', False), 'rand': ('and_', True),
+    'or': ('or_', False), 'ror': ('or_', True),
+    'xor': ('xor', False), 'rxor': ('xor', True),
+    'mul': ('mul', False), 'rmul': ('mul', True),
+    'truediv': ('div', False), 'rtruediv': ('div', True),
+    'floordiv': ('floordiv', False), 'rfloordiv': ('floordiv', True),
+    'pow': ('pow', False), 'rpow': ('pow', True),
+    'mod': ('mod', False), 'rmod': ('mod', True),
+    'eq': ('equal', False), 'req': ('equal', True),
+    'ne': ('not_equal', False), 'rne': ('not_equal', True),
+    'lshift': ('shift_bits_left', False), 'rlshift': ('shift_bits_left', True),
+    'rshift': ('shift_bits_right', False), 'rrshift': ('shift_bits_right', True),
+    'lt': ('less_than', False), 'le': ('less_or_equal', False),
+    'gt': ('greater_than', False), 'ge': ('greater_or_equal', False),
+    'rlt': ('greater_than', False), 'rle': ('greater_or_equal', False),
+    'rgt': ('less_than', False), 'rge': ('less_or_equal', False),
+}
+
+_UFUNC_OPS = {  # NumPy ufunc name -> (_op2 args for tensor ∘ other, _op2 args for other ∘ tensor)
+    'multiply': (_MUL_OPS, _RMUL_OPS),
+    'add': (_ADD_OPS, _RADD_OPS),
+    'subtract': (_SUB_OPS, _RSUB_OPS),
+    'divide': (_TRUEDIV_OPS, _RTRUEDIV_OPS),
+    'true_divide': (_TRUEDIV_OPS, _RTRUEDIV_OPS),
+    'floor_divide': (_FLOORDIV_OPS, _RFLOORDIV_OPS),
+    'remainder': (_MOD_OPS, _RMOD_OPS),
+    'power': (_POW_OPS, _RPOW_OPS),
+    'equal': (_EQ_OPS, _REQ_OPS),
+    'not_equal': (_NE_OPS, _RNE_OPS),
+    'greater': (_GT_OPS, _RGT_OPS),
+    'greater_equal': (_GE_OPS, _RGE_OPS),
+    'less': (_LT_OPS, _RLT_OPS),
+    'less_equal': (_LE_OPS, _RLE_OPS),
+    'left_shift': (_LSHIFT_OPS, _RLSHIFT_OPS),
+    'right_shift': (_RSHIFT_OPS, _RRSHIFT_OPS),
+}
+
+
+def _matmul_dims(shape1: Shape, shape2: Shape) -> Tuple[Optional[Shape], Optional[Shape]]:
+    """ Determines the dims of `shape1 @ shape2` to reduce. """
+    dual_names, primal_names = _matmul_dim_names(shape1.names, shape1.types, shape2.names, shape2.types)
+    if dual_names is None:  # this is not a matrix
+        assert shape1.primal.only(shape2).is_empty, f"Cannot compute matmul {shape1} @ {shape2}. First argument is not a matrix; it has no dual dimensions."
+        return None, None
+    assert primal_names is not None, f"Cannot multiply {shape1} @ {shape2} because arg2 does not have appropriate non-dual dimensions"
+    return shape1.only(dual_names, reorder=True), shape2.only(primal_names, reorder=True)
+
+
+@lru_cache(maxsize=512)
+def _matmul_dim_names(names1: tuple, types1: tuple, names2: tuple, types2: tuple) -> Tuple[Optional[tuple], Optional[tuple]]:
+    """
+    Cached part of `_matmul_dims()`, since matrix products are often repeated with the same dims.
+    Only names and types are used as keys so that the cache holds no sizes, which may be `Tensor`s.
+
+    Returns:
+        dual_names: Dims of the first argument to reduce or `None` if it is not a matrix.
+        primal_names: Matching dims of the second argument or `None` if there are none.
+    """
+    shape1 = Shape((None,) * len(names1), names1, types1, (None,) * len(names1))
+    shape2 = Shape((None,) * len(names2), names2, types2, (None,) * len(names2))
+    match_names = shape1.dual.as_batch().names
+    if not match_names:
+        return None, None
+    match_primal = shape2.only(match_names, reorder=True)
+    if not match_primal:
+        if non_batch(shape2).non_dual.rank != 1:
+            return (), None
+        match_primal = non_batch(shape2).non_dual
+    match_dual = shape1.dual.only(match_primal.as_dual(), reorder=True)
+    return match_dual.names, match_primal.names
+
+
+def _dict_value_at(d: dict, index: int):
+    """ Returns the value at position `index` of `d` without materializing all values. """
+    if 0 <= index < len(d):
+        return next(islice(d.values(), index, None))
+    return tuple(d.values())[index]  # negative or out-of-range index
+
+
+def _native_abs(native):
+    if isinstance(native, np.ndarray):  # NumPy arrays always resolve to the NumPy backend
+        return np.abs(native)
+    return choose_backend(native).abs(native)
+
+
+def _native_round(native):
+    if isinstance(native, np.ndarray):
+        return np.round(native)
+    return choose_backend(native).round(native)
+
+
 TensorOrTree = TypeVar('TensorOrTree', Tensor, PhiTreeNode, numbers.Number, bool, tuple, list, dict)
 
 
@@ -859,13 +945,13 @@ class TensorDim(BoundDim):
         if not self.exists:
             return self.tensor
         shape = self.tensor.shape
-        new_types = list(shape.types)
-        new_types[shape.index(self.name)] = dim_type
-        new_names = shape.names
-        if name is not None:
-            new_names = list(new_names)
-            new_names[shape.index(self.name)] = name
-        new_shape = Shape(shape.sizes, tuple(new_names), tuple(new_types), shape.item_names)
+        i = shape.index(self.name)
+        name = shape.names[i] if name is None else name
+        if shape.types[i] == dim_type and shape.names[i] == name:
+            return self.tensor
+        new_types = shape.types[:i] + (dim_type,) + shape.types[i+1:]
+        new_names = shape.names[:i] + (name,) + shape.names[i+1:]
+        new_shape = Shape(shape.sizes, new_names, new_types, shape.item_names)
         return self.tensor._with_shape_replaced(new_shape)
 
     @property
@@ -901,31 +987,44 @@ class TensorDim(BoundDim):
         return prod(self.tensor, self.name)
 
 
-_EQUALITY_REDUCE = [None]
+class _EqualityReduce(threading.local):
+    mode: Union[str, None] = None  # None, 'ref' or 'shape_and_value'
+
+
+_EQUALITY_REDUCE = _EqualityReduce()
+
+
+def _same_dims(s1: Shape, s2: Shape) -> bool:
+    """ Whether both shapes contain the same dims, including types, sizes and item names, irrespective of dim order. """
+    if s1.names == s2.names:
+        return s1 == s2
+    if s1.rank != s2.rank or not all(n in s2.names for n in s1.names):
+        return False
+    return s1 == s2.only(s1.names, reorder=True)
 
 
 @contextmanager
+def _equality_reduce_mode(mode: str):
+    previous = _EQUALITY_REDUCE.mode
+    _EQUALITY_REDUCE.mode = mode
+    try:
+        yield None
+    finally:
+        _EQUALITY_REDUCE.mode = previous
+
+
 def equality_by_ref():
     """
     Enables Tensor.__bool__
     """
-    _EQUALITY_REDUCE.append('ref')
-    try:
-        yield None
-    finally:
-        assert _EQUALITY_REDUCE.pop(-1) == 'ref'
+    return _equality_reduce_mode('ref')
 
 
-@contextmanager
 def equality_by_shape_and_value():
     """
     Enables Tensor.__bool__
     """
-    _EQUALITY_REDUCE.append('shape_and_value')
-    try:
-        yield None
-    finally:
-        assert _EQUALITY_REDUCE.pop(-1) == 'shape_and_value'
+    return _equality_reduce_mode('shape_and_value')
 
 
 class Layout(Tensor):
@@ -935,6 +1034,8 @@ class Layout(Tensor):
     The PyTree may be deeper but only the outer `shape.rank` levels are represented as a tensor.
     """
 
+    __slots__ = ('_obj', '_shape')
+
     def __init__(self, obj, shape: Shape):
         self._obj = obj
         self._shape = shape
@@ -983,41 +1084,35 @@ class Layout(Tensor):
 
     def _unstack(self, dimension: str):
         if dimension == self._shape.names[0]:
-            native = tuple(self._obj.values()) if isinstance(self._obj, dict) else self._obj
+            native = self._obj.values() if isinstance(self._obj, dict) else self._obj
             inner_shape = self._shape[1:]
             return tuple([Layout(n, inner_shape) for n in native])
         else:
             raise NotImplementedError()
 
     @staticmethod
-    def _getitem_recursive(native, selection: tuple):
-        if not selection:
+    def _getitem_recursive(native, selection: tuple, depth=0):
+        while depth < len(selection) and isinstance(selection[depth], int):  # descend through int selections without building containers
+            native = _dict_value_at(native, selection[depth]) if isinstance(native, dict) else native[selection[depth]]
+            depth += 1
+        if depth == len(selection):
             return native
         native = tuple(native.values()) if isinstance(native, dict) else native
-        if len(selection) == 1:
-            return native if selection[0] is None else native[selection[0]]
+        sel = selection[depth]
+        if depth == len(selection) - 1:
+            return native if sel is None else native[sel]
+        if sel is None:
+            return type(native)([Layout._getitem_recursive(n, selection, depth + 1) for n in native])
+        elif isinstance(sel, slice):
+            subset = native[sel]
+            return type(subset)([Layout._getitem_recursive(n, selection, depth + 1) for n in subset])
         else:
-            if selection[0] is None:
-                return type(native)([Layout._getitem_recursive(n, selection[1:]) for n in native])
-            if isinstance(selection[0], int):
-                return Layout._getitem_recursive(native[selection[0]], selection[1:])
-            elif isinstance(selection[0], slice):
-                subset = native[selection[0]]
-                return type(subset)([Layout._getitem_recursive(n, selection[1:]) for n in subset])
-            else:
-                raise ValueError(f"Illegal selection: {selection}")
+            raise ValueError(f"Illegal selection: {selection}")
 
     def _as_list(self):
-        return self._as_list_recursive(self._obj, self._shape.rank, [])
-
-    @staticmethod
-    def _as_list_recursive(native, dims: int, result: list):
-        if dims == 0:
-            result.append(native)
-        else:
-            native = tuple(native.values()) if isinstance(native, dict) else native
-            for n in native:
-                Layout._as_list_recursive(n, dims - 1, result)
+        result = [self._obj]
+        for _ in range(self._shape.rank):  # flatten one level at a time, preserving order
+            result = [n for native in result for n in (native.values() if isinstance(native, dict) else native)]
         return result
 
     @property
@@ -1085,14 +1180,14 @@ class Layout(Tensor):
             return iter(self._as_list())
 
     def __eq__(self, other):
-        if _EQUALITY_REDUCE[-1]:
+        if _EQUALITY_REDUCE.mode:
             return Tensor.__eq__(self, other)
-        return self._op2(other, lambda x, y: x == y, lambda x, y: x == y, 'eq', '==')
+        return self._op2(other, operator.eq, operator.eq, 'eq', '==')
 
     def __ne__(self, other):
-        if _EQUALITY_REDUCE[-1]:
+        if _EQUALITY_REDUCE.mode:
             return Tensor.__ne__(self, other)
-        return self._op2(other, lambda x, y: x != y, lambda x, y: x != y, 'ne', '!=')
+        return self._op2(other, operator.ne, operator.ne, 'ne', '!=')
     
     def _assert_close(self, other: Tensor, rel_tolerance: float, abs_tolerance: float, msg: str, verbose: bool):
         from ._ops import assert_close
@@ -1100,23 +1195,26 @@ class Layout(Tensor):
         return self._op2(other, inner_test, inner_test, 'assert_close', '≈')
 
     def _op2(self, other, operator: Callable, native_function: Callable, op_name: str = 'unknown', op_symbol: str = '?') -> Tensor:
-        obj = self._recursive_op2(self._obj, self._shape, other, operator, native_function, op_name)
+        obj = self._recursive_op2(self._obj, self._shape.names, other, operator, native_function, op_name)
         new_shape = concat_shapes(self._shape, other.shape.without(self._shape)) if isinstance(other, Tensor) else self._shape
         return Layout(obj, new_shape)
 
     @staticmethod
-    def _recursive_op2(obj, shape: Shape, other, operator, native_function, op_name):
-        if shape:
-            dim = shape.names[0]
+    def _recursive_op2(obj, dims: Tuple[str, ...], other, operator, native_function, op_name):
+        if dims:
+            dim, inner_dims = dims[0], dims[1:]  # slicing the name tuple is much cheaper than slicing the Shape
             if isinstance(other, Tensor) and dim in other.shape:
                 assert other.shape.get_size(dim) == len(obj), f"Shape mismatch during {op_name}: '{dim}' has size {len(obj)} on layout but {other.shape.get_size(dim)} on other tensor."
                 others = [other[{dim: i}] for i in range(len(obj))]
-            else:
-                others = [other] * len(obj)
-            if isinstance(obj, (tuple, list)):
-                return type(obj)([Layout._recursive_op2(i, shape[1:], o, operator, native_function, op_name) for i, o in zip(obj, others)])
-            elif isinstance(obj, dict):
-                return {k: Layout._recursive_op2(v, shape[1:], o, operator, native_function, op_name) for (k, v), o in zip(obj.items(), others)}
+                if isinstance(obj, (tuple, list)):
+                    return type(obj)([Layout._recursive_op2(i, inner_dims, o, operator, native_function, op_name) for i, o in zip(obj, others)])
+                elif isinstance(obj, dict):
+                    return {k: Layout._recursive_op2(v, inner_dims, o, operator, native_function, op_name) for (k, v), o in zip(obj.items(), others)}
+            else:  # other does not vary along dim
+                if isinstance(obj, (tuple, list)):
+                    return type(obj)([Layout._recursive_op2(i, inner_dims, other, operator, native_function, op_name) for i in obj])
+                elif isinstance(obj, dict):
+                    return {k: Layout._recursive_op2(v, inner_dims, other, operator, native_function, op_name) for k, v in obj.items()}
         else:  # leaf
             if isinstance(other, Layout) and not other.shape:
                 return native_function(obj, other.native())
@@ -1139,20 +1237,21 @@ class Layout(Tensor):
         #     return native_function(obj)
 
     @staticmethod
-    def _recursive_cast(obj, shape: Shape, dtype: DType):
-        if shape:
-            if isinstance(obj, (tuple, list)):
-                return type(obj)([Layout._recursive_cast(i, shape[1:], dtype) for i in obj])
-            elif isinstance(obj, dict):
-                return {k: Layout._recursive_cast(v, shape[1:], dtype) for k, v in obj.items()}
-            elif isinstance(obj, Tensor):
-                assert obj.shape == shape
-                from ._ops import cast
-                return cast(obj, dtype)
-            else:
-                raise ValueError(obj)
-        else:
+    def _recursive_cast(obj, shape: Shape, dtype: DType, depth=0):
+        if depth == shape.rank:
             return dtype.kind(obj)
+        elif isinstance(obj, (tuple, list)):
+            if depth == shape.rank - 1:  # cast all leaves of this level at once
+                return type(obj)([dtype.kind(i) for i in obj])
+            return type(obj)([Layout._recursive_cast(i, shape, dtype, depth + 1) for i in obj])
+        elif isinstance(obj, dict):
+            return {k: Layout._recursive_cast(v, shape, dtype, depth + 1) for k, v in obj.items()}
+        elif isinstance(obj, Tensor):
+            assert obj.shape == shape[depth:]
+            from ._ops import cast
+            return cast(obj, dtype)
+        else:
+            raise ValueError(obj)
 
 
 class NativeTensor(Tensor):
@@ -1162,6 +1261,8 @@ class NativeTensor(Tensor):
     The property _shape can contain additional dimensions along which the tensor is constant.
     """
 
+    __slots__ = ('_native', '_native_shape', '_shape')
+
     def __init__(self, native_tensor, native_shape: Shape, expanded_shape: Shape = None):
         expanded_shape = native_shape if expanded_shape is None else expanded_shape
         if DEBUG_CHECKS:
@@ -1182,12 +1283,10 @@ class NativeTensor(Tensor):
         assert all([n in order for n in self._native_shape.names]), f"order must list all essential dimensions but got {order} for tensor {self.shape}"
         backend = self.default_backend
         if order == self._native_shape.names:
-            if self.dtype.precision in [None, get_precision()]:
-                return self._native
-            else:
-                return backend.cast(self._native, DType(self.dtype.kind, precision=get_precision()))
+            return self._native_in_precision(backend)
         # --- Transpose ---
-        perm = self._native_shape.only(order, reorder=False)._perm(self._native_shape.only(order, reorder=True).names)
+        native_names = self._native_shape.names
+        perm = [native_names.index(dim) for dim in order if dim in native_names]
         if perm != list(range(len(perm))):
             transposed = backend.transpose(self._native, perm)  # this will cast automatically
         else:
@@ -1195,13 +1294,45 @@ class NativeTensor(Tensor):
         if len(order) == len(perm):
             return transposed  # nothing to expand
         # --- Expand ---
-        slices = [slice(None) if dim in self._native_shape else None for dim in order]
-        expanded = transposed[tuple(slices)]
-        if not singleton_for_const:
-            multiples = [self._shape.get_size(dim) if dim in self._shape and dim not in self._native_shape else 1 for dim in order]
+        native_names = set(native_names)
+        static_sizes = iter(backend.staticshape(transposed))
+        shape_sizes = dict(zip(self._shape.names, self._shape.sizes))
+        singleton_sizes, multiples = [], []
+        for dim in order:  # single pass over order, computing the reshape and tile arguments together
+            if dim in native_names:
+                singleton_sizes.append(next(static_sizes))
+                multiples.append(1)
+            else:
+                singleton_sizes.append(1)
+                multiples.append(shape_sizes.get(dim, 1))
+        if None in singleton_sizes:  # unknown sizes cannot be passed to reshape
+            expanded = transposed[tuple([slice(None) if dim in native_names else None for dim in order])]
+        else:
+            expanded = backend.reshape(transposed, singleton_sizes)
+        if not singleton_for_const and any(m != 1 for m in multiples):
             expanded = backend.tile(expanded, multiples)
         return expanded
 
+    def _native_in_precision(self, backend: Backend):
+        """ Returns the stored native, cast to the current precision if necessary. `backend` must be the backend of the native. """
+        dtype = backend.dtype(self._native)  # same as self.dtype without resolving the backend again
+        if dtype.precision in [None, get_precision()]:
+            return self._native
+        else:
+            return backend.cast(self._native, DType(dtype.kind, precision=get_precision()))
+
+    def numpy(self, order: Union[str, tuple, list, Shape] = None) -> np.ndarray:
+        if isinstance(self._native, np.ndarray) and self.dtype.precision in [None, get_precision()]:
+            names = parse_dim_order(order, check_rank=self.rank)
+            if (self._shape.names if names is None else names) == self._native_shape.names:
+                return self._native  # already a NumPy array in the requested dim order, nothing to transpose, expand or cast
+        return Tensor.numpy(self, order)
+
+    def __iter__(self):
+        if self.rank > 1 and isinstance(self._native, np.ndarray) and self._native_shape == self._shape and self.dtype.precision in [None, get_precision()]:
+            return iter(self._native.flat)  # lazy iteration in dim order, no flattened copy
+        return Tensor.__iter__(self)
+
     def _cache(self):
         if self._shape == self._native_shape:
             return
@@ -1232,9 +1363,15 @@ class NativeTensor(Tensor):
     def default_backend(self) -> Backend:
         return choose_backend(self._native)
 
+    @property
+    def available(self) -> bool:
+        return choose_backend(self._native).is_available(self._native)
+
     def _with_shape_replaced(self, new_shape):
         if new_shape.rank != self._shape.rank:
             raise IncompatibleShapes(f"Tensor {self} is not compatible with shape {new_shape}", self._shape, new_shape)
+        if new_shape is self._shape:
+            return self
         new_shape = Shape(self._shape.sizes, new_shape.names, new_shape.types, new_shape.item_names)
         native_indices = self._shape.indices(self._native_shape)
         new_native_shape = new_shape[native_indices]
@@ -1261,9 +1398,11 @@ class NativeTensor(Tensor):
     def _getitem(self, selection: dict):
         if not selection:
             return self
-        selections = [slice(None)] * self._native_shape.rank
+        selections = None  # only allocated if a native dim is sliced
         for name, sel in selection.items():
             if name in self._native_shape:
+                if selections is None:
+                    selections = [slice(None)] * self._native_shape.rank
                 selections[self._native_shape.index(name)] = sel
             elif name not in self._shape:
                 assert isinstance(sel, int), f"Attempting slice missing dimension {name} with {selection}"
@@ -1282,11 +1421,82 @@ class NativeTensor(Tensor):
             assert dim in self._shape, f"Cannot unstack tensor {self._shape} along non-existant dimension '{dim}'"
             return (NativeTensor(self._native, new_native_shape, new_shape),) * self._shape.get_size(dim)
 
+    def __unpack_dim__(self, dim: str, unpacked_dims: Shape, **kwargs) -> 'Tensor':
+        # Reshape the stored native in its own dim order instead of transposing / expanding it first
+        def replace_dim(shape: Shape):
+            i = shape.index(dim)
+            new_shape = shape.without(dim)
+            for d in unpacked_dims:
+                new_shape = new_shape._expand(d, pos=i)
+                i += 1
+            return new_shape
+        new_shape = replace_dim(self._shape)
+        if dim not in self._native_shape:
+            return NativeTensor(self._native, self._native_shape, new_shape)
+        new_native_shape = replace_dim(self._native_shape)
+        native = self.default_backend.reshape(self._native, new_native_shape.sizes)
+        return NativeTensor(native, new_native_shape, new_shape)
+
+    def _gather_list(self, dim: str, indices: Union[tuple, list]) -> 'NativeTensor':
+        """ Selects the entries at the integer positions `indices` along `dim` using a single backend gather. """
+        size = self._shape.get_size(dim)
+        for i in indices:
+            if not -size <= i < size:  # some backends wrap or clamp out-of-range gather indices instead of raising
+                raise IndexError(f"Index {i} is out of bounds for dimension '{dim}' with size {size} in tensor {self._shape}")
+        # Same shape as stacking the individual slices, which moves dim according to its type
+        slice_shape = self._shape.after_gather({dim: 0})
+        stack_dim = self._shape[dim].after_gather({dim: indices})
+        if len(indices) == 1:
+            new_shape = slice_shape & stack_dim.with_size(1)
+        else:
+            new_shape = shape_stack(stack_dim, *[slice_shape] * len(indices))
+        if dim not in self._native_shape:
+            return NativeTensor(self._native, self._native_shape, new_shape)
+        backend = self.default_backend
+        native = backend.gather(self._native, backend.as_tensor(indices), self._native_shape.index(dim))
+        return NativeTensor(native, self._native_shape.after_gather({dim: indices}), new_shape)
+
+    def __cast__(self, dtype: DType):
+        if self.dtype == dtype:
+            return self
+        return NativeTensor(self.default_backend.cast(self._native, dtype=dtype), self._native_shape, self._shape)
+
+    def _packable_without_transpose(self, dims: Tuple[str, ...]) -> bool:
+        """ Whether `dims` form a contiguous run in the storage order of the native tensor so they can be packed by a plain reshape. """
+        if not all(d in self._native_shape for d in dims):
+            return False
+        indices = self._native_shape.indices(dims)
+        return indices == tuple(range(indices[0], indices[0] + len(dims)))
+
+    def __pack_dims__(self, dims: Tuple[str, ...], packed_dim: Shape, pos: Union[int, None], **kwargs) -> 'Tensor':
+        if pos is None:
+            pos = min(self._shape.indices(dims))
+        packed_dim = packed_dim.with_sizes([self._shape.only(dims).volume])
+        new_shape = self._shape.without(dims)._expand(packed_dim, pos)
+        if not any(d in self._native_shape for d in dims):  # constant along all dims
+            return NativeTensor(self._native, self._native_shape, new_shape)
+        if self._packable_without_transpose(dims):
+            new_native_shape = self._native_shape.without(dims)._expand(packed_dim, self._native_shape.index(dims[0]))
+            native = self.default_backend.reshape(self._native, new_native_shape.sizes)
+            return NativeTensor(native, new_native_shape, new_shape)
+        return Tensor.__pack_dims__(self, dims, packed_dim, pos, **kwargs)
+
     def _op1(self, native_function):
         native = native_function(self._native)
         return NativeTensor(native, self._native_shape, self._shape) if native is not None else self
 
     def _op2(self, other, operator, native_function, op_name: str = 'unknown', op_symbol: str = '?', switch_args=False):
+        if isinstance(other, NativeTensor) and other._native_shape == self._native_shape:  # aligned natives, no broadcasting required
+            if type(self._native) is type(other._native) and op_name in _BACKEND_OP2:  # same backend, resolve it only once
+                backend = choose_backend(self._native)
+                method, swap = _BACKEND_OP2[op_name]
+                natives = [self._native_in_precision(backend), other._native_in_precision(backend)]
+                if swap != switch_args:
+                    natives = natives[::-1]
+                return NativeTensor(getattr(backend, method)(*natives), self._native_shape, self._shape & other._shape)
+            names = self._native_shape.names
+            natives = [other.native(names), self.native(names)] if switch_args else [self.native(names), other.native(names)]
+            return NativeTensor(native_function(*natives), self._native_shape, self._shape & other._shape)
         try:
             other_tensor = self._tensor(other)
             was_converted = not isinstance(other, Tensor)
@@ -1328,6 +1538,8 @@ class TensorStack(Tensor):
 
     """
 
+    __slots__ = ('_tensors', '_stack_dim', '_shape', '_cached', '_varying_shapes', '_contains_tracer', '_requires_broadcast', '_dtype')
+
     def __init__(self, components: Union[tuple, list], stack_dim: Shape):
         assert isinstance(stack_dim, Shape) and stack_dim.rank == 1, f"stack_dim must be a single-dimension Shape object but got {type(stack_dim)}"
         # assert len(components) > 1, "Use a CollapsedTensor instead"
@@ -1343,14 +1555,18 @@ class TensorStack(Tensor):
             self._varying_shapes = True
         self._shape = shape_stack(self._stack_dim, *[t.shape for t in self._tensors])
         self._cached = None
+        # components are immutable, so these are evaluated once instead of on every operation
+        self._contains_tracer = any(t._is_tracer for t in self._tensors)
+        self._requires_broadcast = self._varying_shapes or not self._shape.well_defined or self._contains_tracer or (bool(self._tensors) and self._tensors[0].shape.is_non_uniform)
+        self._dtype = None  # combined lazily on first access
 
     @property
     def _is_tracer(self) -> bool:
-        return any([t._is_tracer for t in self._tensors])
+        return self._contains_tracer
 
     @property
     def requires_broadcast(self):
-        return self._varying_shapes or not self._shape.well_defined or self._is_tracer or self._tensors[0].shape.is_non_uniform
+        return self._requires_broadcast
     
     @property
     def stack_dim(self):
@@ -1361,9 +1577,11 @@ class TensorStack(Tensor):
         if self._cached is None:
             if self.requires_broadcast:
                 return None
-            elif all([t.shape.is_uniform for t in self._tensors]):
-                natives = [t.native(order=self._shape.names) for t in self._tensors]
-                native = choose_backend(*natives).concat(natives, axis=self.shape.index(self._stack_dim.name))
+            elif all(t.shape.is_uniform for t in self._tensors):
+                # stack the component natives directly instead of expanding each by a singleton stack dim and concatenating
+                inner_order = self._shape.without(self._stack_dim).names
+                natives = [t.native(order=inner_order) for t in self._tensors]
+                native = choose_backend(*natives).stack(natives, axis=self._shape.index(self._stack_dim.name))
                 self._cached = NativeTensor(native, self._shape)
             else:  # cache stack_dim on inner tensors
                 non_uniform_dim = self._tensors[0].shape.shape.without('dims')
@@ -1379,7 +1597,9 @@ class TensorStack(Tensor):
 
     @property
     def dtype(self):
-        return combine_types(*[t.dtype for t in self._tensors])
+        if self._dtype is None:
+            self._dtype = combine_types(*[t.dtype for t in self._tensors])
+        return self._dtype
 
     @property
     def shape(self):
@@ -1395,7 +1615,10 @@ class TensorStack(Tensor):
                 inner_order = [dim for dim in order if dim != self._stack_dim.name]
                 natives = [t.native(inner_order) for t in self._tensors]
                 assert self._stack_dim.name in order, f"Dimension {self._stack_dim} missing from 'order'. Got {order} but tensor has shape {self.shape}."
-                native = choose_backend(*natives).stack(natives, axis=order.index(self._stack_dim.name))
+                backend = choose_backend(*natives)
+                native = backend.stack(natives, axis=order.index(self._stack_dim.name))
+                if order == self._shape.names and not self.requires_broadcast:  # later operations reuse the stacked native
+                    self._cached = NativeTensor(backend.copy(native), self._shape)  # the caller may modify the returned native in-place
                 return native
             assert not self.shape.is_non_uniform, f"Cannot convert non-uniform tensor with shape {self.shape} to native tensor."
             return self._cache().native(order=order)
@@ -1405,9 +1628,10 @@ class TensorStack(Tensor):
             return self._cached._with_shape_replaced(new_shape)
         else:
             new_stack_dim = new_shape[self._shape.index(self._stack_dim.name)]
+            name_index = {name: i for i, name in enumerate(self._shape.names)}  # built once for all components
             new_tensors = []
             for t in self._tensors:
-                inner_indices = [self.shape.index(d) for d in t.shape.names]
+                inner_indices = [name_index[d] for d in t.shape.names]
                 new_inner_shape = new_shape[inner_indices]
                 new_tensors.append(t._with_shape_replaced(new_inner_shape))
             return TensorStack(new_tensors, new_stack_dim)
@@ -1454,10 +1678,14 @@ class TensorStack(Tensor):
             return self._cache()._op1(native_function)
 
     def _op2(self, other, operator, native_function, op_name: str = 'unknown', op_symbol: str = '?'):
-        other = self._tensor(other)
+        if not isinstance(other, Tensor):
+            other = self._tensor(other)
         if self.requires_broadcast:
             if self._stack_dim.name in other.shape:
-                other_slices = other._unstack(self._stack_dim.name)
+                if isinstance(other, TensorStack) and other._stack_dim.name == self._stack_dim.name:
+                    other_slices = other._tensors  # reuse the components, even if other has been cached
+                else:
+                    other_slices = other._unstack(self._stack_dim.name)
                 tensors = [operator(t1, t2) for t1, t2 in zip(self._tensors, other_slices)]
             else:
                 tensors = [operator(t, other) for t in self._tensors]
@@ -1468,7 +1696,7 @@ class TensorStack(Tensor):
             return NativeTensor(result_tensor, new_shape, new_shape)
         elif isinstance(other, TensorStack) and other.requires_broadcast:
             if other._stack_dim.name in self.shape:
-                self_slices = self._unstack(other._stack_dim.name)
+                self_slices = self._tensors if other._stack_dim.name == self._stack_dim.name else self._unstack(other._stack_dim.name)
                 tensors = [operator(t1, t2) for t1, t2 in zip(self_slices, other._tensors)]
             else:
                 tensors = [operator(self, t) for t in other._tensors]
@@ -1480,7 +1708,7 @@ class TensorStack(Tensor):
         if self._cached is not None:
             return self._cached._natives()
         else:
-            return sum([t._natives() for t in self._tensors], ())
+            return tuple([n for t in self._tensors for n in t._natives()])
 
     def _spec_dict(self) -> dict:
         if self._cached is not None:
@@ -1517,6 +1745,10 @@ class TensorStack(Tensor):
             return self
 
 
+_NUMERIC_TYPES = frozenset({bool, int, float, complex})
+_STR_TYPES = frozenset({str})
+
+
 def tensor(data,
            *shape: Shape,
            convert: bool = True,
@@ -1578,7 +1810,7 @@ def tensor(data,
         (vectorᶜ=10) float64 -0.128 ± 1.197 (-2e+00...2e+00)
     """
     assert all(isinstance(s, Shape) for s in shape), f"Cannot create tensor because shape needs to be one or multiple Shape instances but got {shape}"
-    shape = None if len(shape) == 0 else concat_shapes(*shape)
+    shape = None if len(shape) == 0 else (shape[0] if len(shape) == 1 else concat_shapes(*shape))
     if isinstance(data, Tensor):
         if convert:
             backend = data.default_backend
@@ -1604,17 +1836,18 @@ def tensor(data,
             data = data.sizes
     elif isinstance(data, str) or data is None:
         return layout(data)
-    elif isinstance(data, (numbers.Number, bool)):
+    elif type(data) in _NUMERIC_TYPES or isinstance(data, (numbers.Number, bool)):  # exact types first, avoids the ABC check for Python numbers
         assert not shape, f"Trying to create a zero-dimensional Tensor from value '{data}' but shape={shape}"
         if convert:
             data = default_backend().as_tensor(data, convert_external=True)
         return NativeTensor(data, EMPTY_SHAPE)
     if isinstance(data, (tuple, list)):
-        if all(isinstance(d, (bool, int, float, complex)) for d in data):
+        types = set(map(type, data))  # exact type check first, isinstance only needed for subclasses
+        if types <= _NUMERIC_TYPES or all(isinstance(d, (bool, int, float, complex)) for d in data):
             array = np.array(data)
             assert array.dtype != object
             data = array
-        elif all(isinstance(d, str) for d in data):
+        elif types == _STR_TYPES or all(isinstance(d, str) for d in data):
             return layout(data, shape or default_list_dim)
         else:
             try:
@@ -1636,12 +1869,13 @@ def tensor(data,
         else:
             # fill in sizes or check them
             sizes = backend.staticshape(data)
-            if len(sizes) != len(shape):
-                raise IncompatibleShapes(f"Rank of given shape {shape} does not match data with sizes {sizes}")
-            for size, s in zip(sizes, shape.sizes):
-                if s is not None:
-                    assert s == size, f"Given shape {shape} does not match data with sizes {sizes}. Consider leaving the sizes undefined."
-            shape = shape.with_sizes(sizes, keep_item_names=True)
+            if sizes != shape.sizes:  # sizes already match -> shape can be used as-is
+                if len(sizes) != len(shape):
+                    raise IncompatibleShapes(f"Rank of given shape {shape} does not match data with sizes {sizes}")
+                for size, s in zip(sizes, shape.sizes):
+                    if s is not None:
+                        assert s == size, f"Given shape {shape} does not match data with sizes {sizes}. Consider leaving the sizes undefined."
+                shape = shape.with_sizes(sizes, keep_item_names=True)
         if convert:
             data = convert_(data, use_dlpack=False)
         return NativeTensor(data, shape)
@@ -1793,8 +2027,8 @@ def custom_op2(x: Union[Tensor, float], y: Union[Tensor, float], l_operator, l_n
     """
     if op_symbol is None:
         op_symbol = op_name
-    x = wrap(x)
-    y = wrap(y)
+    x = x if isinstance(x, Tensor) else wrap(x)
+    y = y if isinstance(y, Tensor) else wrap(y)
     result = x._op2(y, l_operator, l_native_function, op_name, op_symbol)
     if result is NotImplemented:
         if r_operator is None:
@@ -1821,7 +2055,7 @@ def disassemble_tensors(tensors: Union[Tuple[Tensor, ...], List[Tensor]], expand
     for t in tensors:
         if isinstance(t, TensorStack) or expand:
             t._expand()
-    natives = sum([t._natives() for t in tensors], ())
+    natives = tuple([n for t in tensors for n in t._natives()])
     shapes = tuple([t.shape for t in tensors])
     specs = tuple([t._spec_dict() for t in tensors])
     return natives, shapes, specs
@@ -1856,45 +2090,38 @@ def disassemble_tree(obj: PhiTreeNodeType) -> Tuple[PhiTreeNodeType, List[Tensor
         empty structure: Same structure as `obj` but with the tensors replaced by `None`.
         tensors: Ordered `list` of all contained `Tensor` objects.
     """
+    values = []
+    return _disassemble(obj, values), values
+
+
+def _disassemble(obj: PhiTreeNodeType, values: List[Tensor]):
+    """ Implementation of `disassemble_tree()`. Appends all contained tensors to `values` and returns the empty structure. """
     if obj is None:
-        return MISSING_TENSOR, []
+        return MISSING_TENSOR
     elif isinstance(obj, Tensor):
-        return None, [obj]
-    elif isinstance(obj, (tuple, list)):
-        keys = []
-        values = []
-        for item in obj:
-            key, value = disassemble_tree(item)
-            keys.append(key)
-            values.extend(value)
-        return (tuple(keys) if isinstance(obj, tuple) else keys), values
+        values.append(obj)
+        return None
+    elif isinstance(obj, tuple):
+        return tuple([_disassemble(item, values) for item in obj])
+    elif isinstance(obj, list):
+        return [_disassemble(item, values) for item in obj]
     elif isinstance(obj, dict):
-        keys = {}
-        values = []
-        for name, item in obj.items():
-            key, value = disassemble_tree(item)
-            keys[name] = key
-            values.extend(value)
-        return keys, values
+        return {name: _disassemble(item, values) for name, item in obj.items()}
     elif isinstance(obj, PhiTreeNode):
         attributes = variable_attributes(obj)
-        keys = {}
-        values = []
-        for attr in attributes:
-            key, value = disassemble_tree(getattr(obj, attr))
-            keys[attr] = key
-            values.extend(value)
-        return copy_with(obj, **keys), values
+        keys = {attr: _disassemble(getattr(obj, attr), values) for attr in attributes}
+        return copy_with(obj, **keys)
     else:
         try:
             backend = choose_backend(obj)
             if backend == OBJECTS:
-                return obj, []
+                return obj
             sizes = backend.staticshape(obj)
             shape = Shape(sizes, tuple([f"dim{i}" for i in range(len(sizes))]), (None,) * len(sizes), (None,) * len(sizes))
-            return NATIVE_TENSOR, [NativeTensor(obj, shape)]
+            values.append(NativeTensor(obj, shape))
+            return NATIVE_TENSOR
         except NoBackendFound:
-            return obj, []
+            return obj
 
 
 def assemble_tree(obj: PhiTreeNodeType, values: List[Tensor]) -> PhiTreeNodeType:
@@ -1930,11 +2157,11 @@ def cached(t: Union[Tensor, 'PhiTreeNode']) -> Union[Tensor, 'PhiTreeNode']:
     elif isinstance(t, TensorStack):
         if t._cached is not None:
             return t._cached
-        inners = cached(t._tensors)
         if t.requires_broadcast:
-            return TensorStack(inners, t._stack_dim)
-        else:
-            natives = [t.native(order=t.shape.names) for t in inners]
+            return TensorStack(cached(t._tensors), t._stack_dim)
+        else:  # stack the expanded component natives directly, without caching each component first
+            inner_order = t.shape.without(t._stack_dim).names
+            natives = [c.native(order=inner_order) for c in t._tensors]
             native = choose_backend(*natives).stack(natives, axis=t.shape.index(t._stack_dim.name))
             return NativeTensor(native, t.shape)
     elif isinstance(t, Layout):
@@ -1958,7 +2185,12 @@ def expand_tensor(value: Tensor, dims: Shape):
             stack_dim = dims.shape.without('dims')
             if stack_dim.rank > 1:
                 raise NotImplementedError("Higher-order non-uniform expand() not yet supported")
-            unstacked_dims = [dims.after_gather(i) for i in stack_dim.meshgrid()]
+            if stack_dim.name in dims:  # unstack all varying sizes once instead of gathering them per index
+                sizes = [s._unstack(stack_dim.name) if isinstance(s, Tensor) and stack_dim.name in s.shape else (s,) * stack_dim.size for s in dims.sizes]
+                sizes = [[int(s) if isinstance(s, Tensor) and s.rank == 0 else s for s in sizes_i] for sizes_i in zip(*sizes)]
+                unstacked_dims = [dims.with_sizes(sizes_i, keep_item_names=True).without(stack_dim) for sizes_i in sizes]
+            else:
+                unstacked_dims = [dims] * stack_dim.size
             components = [NativeTensor(value._native, value._native_shape, inner_shape) for inner_shape in unstacked_dims]
             return TensorStack(components, stack_dim)
     if isinstance(value, TensorStack):
@@ -1998,139 +2230,87 @@ class Dict(dict):
             raise AttributeError(k)
         
     # --- operators ---
-    
+
+    def _op2(self, other, operator: Callable) -> 'Dict':
+        """ Applies `operator(value, other_value)` to all values. `other` can be a `Dict` with the same keys or a value to use for all entries. """
+        if isinstance(other, Dict):
+            if tuple(self) == tuple(other):  # same keys in same order, values can be paired directly
+                return Dict(zip(self, map(operator, self.values(), other.values())))
+            return Dict({key: operator(val, other[key]) for key, val in self.items()})
+        return Dict(zip(self, map(operator, self.values(), repeat(other))))
+
     def __neg__(self):
-        return Dict({k: -v for k, v in self.items()})
-    
+        return Dict(zip(self, map(operator.neg, self.values())))
+
     def __invert__(self):
-        return Dict({k: ~v for k, v in self.items()})
-    
+        return Dict(zip(self, map(operator.invert, self.values())))
+
     def __abs__(self):
-        return Dict({k: abs(v) for k, v in self.items()})
-    
+        return Dict(zip(self, map(abs, self.values())))
+
     def __round__(self, n=None):
-        return Dict({k: round(v) for k, v in self.items()})
+        return Dict(zip(self, map(round, self.values())))
 
     def __add__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val + other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val + other for key, val in self.items()})
+        return self._op2(other, operator.add)
 
     def __radd__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: other[key] + val for key, val in self.items()})
-        else:
-            return Dict({key: other + val for key, val in self.items()})
+        return self._op2(other, _RADD_OPS[0])
 
     def __sub__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val - other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val - other for key, val in self.items()})
+        return self._op2(other, operator.sub)
 
     def __rsub__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: other[key] - val for key, val in self.items()})
-        else:
-            return Dict({key: other - val for key, val in self.items()})
+        return self._op2(other, _RSUB_OPS[0])
 
     def __mul__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val * other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val * other for key, val in self.items()})
+        return self._op2(other, operator.mul)
 
     def __rmul__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: other[key] * val for key, val in self.items()})
-        else:
-            return Dict({key: other * val for key, val in self.items()})
+        return self._op2(other, _RMUL_OPS[0])
 
     def __truediv__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val / other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val / other for key, val in self.items()})
+        return self._op2(other, operator.truediv)
 
     def __rtruediv__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: other[key] / val for key, val in self.items()})
-        else:
-            return Dict({key: other / val for key, val in self.items()})
+        return self._op2(other, _RTRUEDIV_OPS[0])
 
     def __floordiv__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val // other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val // other for key, val in self.items()})
+        return self._op2(other, operator.floordiv)
 
     def __rfloordiv__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: other[key] // val for key, val in self.items()})
-        else:
-            return Dict({key: other // val for key, val in self.items()})
+        return self._op2(other, _RFLOORDIV_OPS[0])
 
     def __pow__(self, power, modulo=None):
         assert modulo is None
-        if isinstance(power, Dict):
-            return Dict({key: val ** power[key] for key, val in self.items()})
-        else:
-            return Dict({key: val ** power for key, val in self.items()})
+        return self._op2(power, operator.pow)
 
     def __rpow__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: other[key] ** val for key, val in self.items()})
-        else:
-            return Dict({key: other ** val for key, val in self.items()})
+        return self._op2(other, _RPOW_OPS[0])
 
     def __mod__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val % other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val % other for key, val in self.items()})
+        return self._op2(other, operator.mod)
 
     def __rmod__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: other[key] % val for key, val in self.items()})
-        else:
-            return Dict({key: other % val for key, val in self.items()})
+        return self._op2(other, _RMOD_OPS[0])
 
     def __eq__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val == other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val == other for key, val in self.items()})
+        return self._op2(other, operator.eq)
 
     def __ne__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val != other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val != other for key, val in self.items()})
+        return self._op2(other, operator.ne)
 
     def __lt__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val < other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val < other for key, val in self.items()})
+        return self._op2(other, operator.lt)
 
     def __le__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val <= other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val <= other for key, val in self.items()})
+        return self._op2(other, operator.le)
 
     def __gt__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val > other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val > other for key, val in self.items()})
+        return self._op2(other, operator.gt)
 
     def __ge__(self, other):
-        if isinstance(other, Dict):
-            return Dict({key: val >= other[key] for key, val in self.items()})
-        else:
-            return Dict({key: val >= other for key, val in self.items()})
+        return self._op2(other, operator.ge)
 
     # --- overridden methods ---
 
@@ -2226,8 +2406,11 @@ class Color:
     console_foreground_begin: str
 
     def __call__(self, obj, **kwargs):
-        text = str(obj).replace(CONSOLE_END, self.console_foreground_begin)
-        return f"{self.console_foreground_begin}{text}{CONSOLE_END if self.console_foreground_begin else ''}"
+        text = str(obj)
+        begin = self.console_foreground_begin
+        if CONSOLE_END in text:
+            text = text.replace(CONSOLE_END, begin)
+        return f"{begin}{text}{CONSOLE_END}" if begin else text
 
 
 DEFAULT = Color("Default", '')
@@ -2249,6 +2432,11 @@ class ColorScheme:
 DEFAULT_COLORS = ColorScheme(BLUE, GREEN, YELLOW, GREY)
 NO_COLORS = ColorScheme(DEFAULT, DEFAULT, DEFAULT, DEFAULT)
 
+_FORMAT_LAYOUTS = ('summary', 'full', 'row', 'numpy')
+_FORMAT_FLAGS = {'shape': ('include_shape', True), 'no-shape': ('include_shape', False),
+                 'dtype': ('include_dtype', True), 'no-dtype': ('include_dtype', False),
+                 'color': ('colors', True), 'no-color': ('colors', False)}
+
 
 @dataclass
 class PrintOptions:
@@ -2258,6 +2446,7 @@ class PrintOptions:
     colors: ColorScheme = None
     include_shape: bool = None
     include_dtype: bool = None
+    _auto_colors: ColorScheme = field(default=None, init=False, repr=False, compare=False)  # colors=None resolved by get_colors()
 
     def get_colors(self):
         if self.colors is True:
@@ -2266,24 +2455,42 @@ class PrintOptions:
             return NO_COLORS
         elif self.colors is not None:
             return self.colors
-        else:  # None
-            return DEFAULT_COLORS if check_is_printing() else NO_COLORS
+        else:  # None, resolve once since check_is_printing() walks the call stack
+            if self._auto_colors is None:
+                self._auto_colors = DEFAULT_COLORS if check_is_printing() else NO_COLORS
+            return self._auto_colors
 
 
 def check_is_printing():
-    import traceback, sys
-    stack = traceback.extract_stack()
-    for frame in stack:
-        if "_pydevd_bundle\\pydevd_xml.py" in frame.filename or "_pydevd_bundle/pydevd_xml.py" in frame.filename:
+    import sys, linecache
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None:  # walk the frames directly instead of extracting the full stack with all source lines
+        filename = frame.f_code.co_filename
+        if "_pydevd_bundle\\pydevd_xml.py" in filename or "_pydevd_bundle/pydevd_xml.py" in filename:
             return False
-    for frame in stack:
-        if frame.line.strip().startswith('print('):
+        frames.append((filename, frame.f_lineno))
+        frame = frame.f_back
+    for filename, lineno in frames:  # source lines are only read until a print() call is found
+        if linecache.getline(filename, lineno).strip().startswith('print('):
             return True
     if 'ipykernel' in sys.modules:
         return True
     return False
 
 
+def _summary_statistics(value: Tensor) -> Tuple[float, float, float, float]:
+    """ Returns finite min, finite max, finite mean and std of all values, as printed by `format_summary()`. """
+    if isinstance(value, NativeTensor) and isinstance(value._native, np.ndarray):
+        # Expanded dims repeat all values equally often, so the stored array has the same statistics.
+        values = value._native
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            return float('nan'), float('nan'), float('nan'), float(np.std(values))
+        return float(finite.min()), float(finite.max()), float(finite.mean()), float(np.std(values))
+    return tuple([float(f) for f in [value.finite_min, value.finite_max, value.finite_mean, value.std]])
+
+
 def format_summary(self: Tensor, options: PrintOptions) -> str:
     """
     Returns shape + dtype + content summary
@@ -2308,7 +2515,7 @@ def format_summary(self: Tensor, options: PrintOptions) -> str:
         elif self.dtype.kind == bool:
             tokens.append(colors.value(f"{self.sum} / {self.shape.volume} True"))
         elif self.dtype.kind in (float, int):
-            min_val, max_val, mean, std = [float(f) for f in [self.finite_min, self.finite_max, self.finite_mean, self.std]]
+            min_val, max_val, mean, std = _summary_statistics(self)
             if std == 0:
                 tokens.append(colors.value(f"const {mean:{options.float_format or ''}}"))
             else:
@@ -2338,8 +2545,11 @@ def sparse_summary(value: Tensor, options: PrintOptions) -> str:
     return " ".join(tokens)
 
 
+_EXPECTED_DTYPES = frozenset([DType(bool), DType(int, 32)])
+
+
 def is_unexpected_dtype(dtype: DType):
-    if dtype in [DType(bool), DType(int, 32)]:
+    if dtype in _EXPECTED_DTYPES:
         return False
     if dtype.kind == float and dtype.precision == get_precision():
         return False
@@ -2354,12 +2564,15 @@ def format_tracer(self: Tensor, options: PrintOptions) -> str:
         return f"{colors.shape(self.shape)} {colors.dtype(self.dtype)} {colors.value(f'{self.default_backend} tracer')}"
 
 
+_STRIP_BRACKETS = str.maketrans('', '', '[]')
+_STRIP_BRACKETS_AND_COMMAS = str.maketrans(',', ' ', '[]')
+
+
 def format_full(value: Tensor, options: PrintOptions) -> str:  # multi-line content
     if not value.available:
         return format_tracer(value, options)
     from ._sparse import dense
     value = dense(value)
-    import re
     colors = options.get_colors()
     dim_order = tuple(sorted(value.shape.spatial.names, reverse=True))
     lines = []
@@ -2379,13 +2592,16 @@ def format_full(value: Tensor, options: PrintOptions) -> str:  # multi-line cont
             primal = dual(value).as_spatial().name
             if primal not in value.shape:
                 primal = non_batch(value).non_dual.name
+            include_shape = options.include_shape is not False
+            if include_shape:
+                prefixes = prefix_indices(non_batch(value).non_dual, colors)
+                along = colors.shape(dual_dim)
             for b in batch(value).meshgrid(names=True):
                 text = " " + np.array2string(value[b].numpy([primal, dual_dim]), separator=', ', max_line_width=np.inf) + " "
-                text = re.sub('[\\[\\]]', '', text).replace(',', ' ')
-                prefixes = prefix_indices(non_batch(value).non_dual, colors)
-                if options.include_shape is not False:
+                text = text.translate(_STRIP_BRACKETS_AND_COMMAS)
+                if include_shape:
                     for line, prefix in zip(text.split("\n"), prefixes):
-                        lines.append(f"{prefix}  {colors.value(line)} along {colors.shape(dual_dim)}")
+                        lines.append(f"{prefix}  {colors.value(line)} along {along}")
                 else:
                     lines.append(colors.value(text))
         elif value.shape.spatial_rank == 0:  # no spatial or dual dimensions
@@ -2393,17 +2609,19 @@ def format_full(value: Tensor, options: PrintOptions) -> str:  # multi-line cont
                 lines.append(colors.shape(value.shape))
             if value.shape.rank <= 1:
                 text = np.array2string(value.numpy(), separator=', ', max_line_width=np.inf)
-                lines.append(' ' + re.sub('[\\[\\]]', '', text))
+                lines.append(' ' + text.translate(_STRIP_BRACKETS))
             else:
                 text = np.array2string(value.numpy(value.shape), separator=', ', max_line_width=np.inf)
                 lines.append(text)
         elif value.shape.spatial_rank in (1, 2):
-            if value.shape.non_spatial.volume > 1:
+            has_index = value.shape.non_spatial.volume > 1
+            if has_index:
                 indices = [f"{colors.shape(', '.join(f'{name}={idx}' for name, idx in index_dict.items()))}" for index_dict in value.shape.non_spatial.meshgrid(names=True)]
                 max_index_length = max(len(index) for index in indices)
+            along = f"  along {colors.shape(spatial(value))}" if options.include_shape is not False else ""
             for i, index_dict in enumerate(value.shape.non_spatial.meshgrid(names=True)):
                 row = ""
-                if value.shape.non_spatial.volume > 1:
+                if has_index:
                     row += indices[i] + " " * (max_index_length - len(indices[i]) + 2)
                     if value.shape.spatial_rank == 2:
                         row += "\n"
@@ -2411,7 +2629,7 @@ def format_full(value: Tensor, options: PrintOptions) -> str:  # multi-line cont
                     text = np.array2string(value[index_dict].numpy(dim_order), separator=', ', max_line_width=np.inf)
                 else:
                     text = " " + np.array2string(value[index_dict].numpy(dim_order)[::-1], separator=', ', max_line_width=np.inf)
-                lines.append(row + colors.value(re.sub('[\\[\\]]', '', text)) + (f"  along {colors.shape(spatial(value))}" if options.include_shape is not False else ""))
+                lines.append(row + colors.value(text.translate(_STRIP_BRACKETS)) + along)
         else:
             raise NotImplementedError('Can only print tensors with up to 2 spatial dimensions.')
     return "\n".join(lines)
@@ -2419,9 +2637,8 @@ def format_full(value: Tensor, options: PrintOptions) -> str:  # multi-line cont
 
 def prefix_indices(index_shape, colors: ColorScheme):
     prefixes = [f"{colors.shape(', '.join(f'{name}={idx}' for name, idx in index_dict.items()))}" for index_dict in index_shape.meshgrid(names=True)]
-    max_len = max(len(p) for p in prefixes)
-    prefixes = [p + " " * (max_len - len(p) + 2) for p in prefixes]
-    return prefixes
+    width = max(map(len, prefixes)) + 2
+    return [p.ljust(width) for p in prefixes]
 
 
 def format_row(self: Tensor, options: PrintOptions) -> str:  # all values in a single line
@@ -2454,7 +2671,8 @@ def format_row(self: Tensor, options: PrintOptions) -> str:  # all values in a s
         if channel(self):
             rows = [_format_vector(self[b], options) for b in self.shape.non_channel.meshgrid()]
         else:
-            rows = [_format_number(self[b].numpy(), options, self.dtype) for b in self.shape.non_channel.meshgrid()]
+            fmt = _number_formatter(options, self.dtype)
+            rows = [fmt(self[b].numpy()) for b in self.shape.non_channel.meshgrid()]
         content = "; ".join(rows)
         if options.include_shape is not False:
             content += " " + colors.shape(self.shape)
@@ -2486,23 +2704,28 @@ def _format_vector(self: Tensor, options: PrintOptions) -> str:
     if self.shape.rank > 1:
         from ._magic_ops import flatten
         self = flatten(self, channel('flat'))
+    fmt = _number_formatter(options, self.dtype)
+    # Python scalars format faster than NumPy scalars and print identically for these kinds
+    values = self.numpy().tolist() if self.dtype.kind in (bool, int, float) else self
     if self.shape.get_item_names(0) is not None and options.include_shape is not False:
-        content = ", ".join([f"{item}={_format_number(number, options, self.dtype)}" for number, item in zip(self, self.shape.get_item_names(0))])
+        content = ", ".join([f"{item}={fmt(number)}" for number, item in zip(values, self.shape.get_item_names(0))])
     else:
-        content = ", ".join([_format_number(num, options, self.dtype) for num in self])
+        content = ", ".join(map(fmt, values))
     return colors.value(f"({content})")
 
 
-def _format_number(num, options: PrintOptions, dtype: DType):
+def _number_formatter(options: PrintOptions, dtype: DType) -> Callable[[Any], str]:
+    """ Selects the number format once so it can be applied to many elements. """
     if options.float_format is not None:
-        return format(num, options.float_format)
+        spec = options.float_format
+        return lambda num: format(num, spec)
     if dtype.kind == int:
-        return format(num, 'd')
+        return lambda num: format(num, 'd')
     if dtype.kind == bool:
-        return str(bool(num))
+        return lambda num: str(bool(num))
     if dtype.kind == float:
-        return format(num, options.float_format or '.3f')
-    return str(num)
+        return lambda num: format(num, '.3f')
+    return str
 
 
 def format_tensor(self: Tensor, options: PrintOptions) -> str:
@@ -2553,13 +2776,16 @@ def may_vary_along(value, dims: DimFilter):
 
 
 def specs_equal(spec1, spec2):
-    if isinstance(spec1, Tensor) or isinstance(spec2, Tensor):
-        if isinstance(spec1, Tensor) and isinstance(spec2, Tensor):
-            from ._ops import close
-            return close(spec1, spec2, rel_tolerance=0, abs_tolerance=0)
+    if spec1 is spec2:  # shared sub-specs, e.g. Shapes reused across tensors
+        return True
+    is_tensor1, is_tensor2 = isinstance(spec1, Tensor), isinstance(spec2, Tensor)
+    if is_tensor1 and is_tensor2:
+        from ._ops import close
+        return close(spec1, spec2, rel_tolerance=0, abs_tolerance=0)
+    if is_tensor1 or is_tensor2:
         return False
     if isinstance(spec1, dict):
-        return set(spec1) == set(spec2) and all([key in spec2 and specs_equal(spec1[key], spec2[key]) for key in spec1.keys()])
+        return spec1.keys() == set(spec2) and all(specs_equal(v, spec2[k]) for k, v in spec1.items())
     if isinstance(spec1, (tuple, list)):
-        return len(spec1) == len(spec2) and all([specs_equal(s1, s2) for s1, s2 in zip(spec1, spec2)])
+        return len(spec1) == len(spec2) and all(map(specs_equal, spec1, spec2))
     return spec1 == spec2
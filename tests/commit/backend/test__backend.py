@@ -233,6 +233,14 @@ class TestBackends(TestCase):
             numpy.testing.assert_equal([3, 2], b.numpy(b.multi_slice(data, (slice(-2, 0, -1),))))
             numpy.testing.assert_equal([3, 2], b.numpy(b.multi_slice(data, (slice(-2, -4, -1),))))
 
+    def test_reshape_transposed(self):
+        for b in BACKENDS:
+            for shape, perm in [((256, 512), (1, 0)), ((2, 256, 128), (0, 2, 1)), ((2, 256, 128, 3), (0, 2, 1, 3))]:
+                data = numpy.arange(numpy.prod(shape)).reshape(shape)
+                transposed = b.transpose(b.as_tensor(data), perm)
+                for new_shape in [(-1,), (shape[0], -1), (shape[perm[0]], shape[perm[1]], -1)]:
+                    numpy.testing.assert_equal(numpy.transpose(data, perm).reshape(new_shape), b.numpy(b.reshape(transposed, new_shape)))
+
     def test_get_backend(self):
         torch = get_backend('torch')
         self.assertEqual('torch', torch.name)
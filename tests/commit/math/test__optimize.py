@@ -98,6 +98,9 @@ class TestOptimize(TestCase):
             assert solves[solve].x.trajectory.size >= 3
             math.assert_close(solves[solve].residual.trajectory[-1], 0, abs_tolerance=1e-3)
             # math.print(solves[solve].x.vector[1])
+            columns = solves.as_columns()
+            assert columns['method'] == [solves[0].method]
+            assert columns['iterations'].solve.size == 1
 
     def test_solve_linear_function_batched(self):
         y = math.ones(spatial(x=3)) * math.vec(x=1, y=2)
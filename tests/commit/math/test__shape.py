@@ -125,6 +125,12 @@ class TestShape(TestCase):
     def test_merge_shaped(self):
         self.assertEqual(spatial(x=4, y=3, z=2), math.merge_shapes(ShapedDummy(spatial(x=4, y=3)), spatial(y=3, z=2)))
 
+    def test_merge_equal_shapes(self):
+        s = batch(b=2) & spatial(x=4, y=3) & channel(vector='x,y')
+        self.assertIs(s, math.merge_shapes(s, s, s))
+        ungrouped = math.concat_shapes(channel(vector='x,y'), batch(b=2))
+        self.assertEqual(('b', 'vector'), math.merge_shapes(ungrouped, ungrouped).names)
+
     def test_concat_shaped(self):
         self.assertEqual(spatial(x=4, y=3, z=2), math.concat_shapes(ShapedDummy(spatial(x=4, y=3)), spatial(z=2)))
 
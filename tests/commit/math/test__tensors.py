@@ -6,10 +6,10 @@ import numpy as np
 from phiml import math
 from phiml.backend import Backend
 from phiml.backend._backend import init_installed_backends
-from phiml.math import channel, batch, DType, vec, stack, expand
+from phiml.math import channel, batch, DType, vec, stack, expand, concat_shapes
 from phiml.math._shape import shape_stack, spatial, instance
 from phiml.math._tensors import wrap, tensor, cached, disassemble_tensors, assemble_tensors, \
-    Layout, equality_by_ref
+    Layout, equality_by_ref, TensorStack, NativeTensor, Tensor
 from phiml.math.magic import PhiTreeNode
 
 BACKENDS = init_installed_backends()
@@ -313,6 +313,72 @@ class TestTensors(TestCase):
         math.assert_close(x.c[0], x[0])
         math.assert_close(x.c[(0, 1)], x[[0, 1]])
 
+    def test_slice_int_list(self):
+        x = math.expand(math.random_normal(spatial(x=4), channel(c='x,y,z')), batch(b=2))
+        sel = x.x[[3, 0, -1]].c[['z', 'x']]
+        self.assertEqual(spatial(x=3) & channel(c='z,x') & batch(b=2), sel.shape)
+        math.assert_close(x.x[3].c['z'], sel.x[0].c['z'])
+        math.assert_close(x.x[-1].c['x'], sel.x[2].c['x'])
+        self.assertEqual(batch(b=2), x.b[[1, 0]].shape.batch)
+
+    def test_slice_int_list_dim_order(self):
+        x = math.wrap(np.random.rand(3, 4, 2), channel(c='x,y,z'), spatial('x'), batch('b'))
+        stacked = TensorStack(x.b.unstack(), batch('b'))
+        for sel in [{'x': [3, 0]}, {'c': ['z', 'x']}, {'b': [1, 0]}, {'x': [2]}]:
+            self.assertEqual(stacked[sel].shape.names, x[sel].shape.names)
+            math.assert_close(stacked[sel], x[sel])
+
+    def test_slice_int_list_out_of_range(self):
+        for backend in BACKENDS:
+            with backend:
+                t = math.tensor(np.arange(12.).reshape(3, 4), spatial('x'), channel('c'))
+                math.assert_close([8, 9, 10, 11], t.x[[-1]].x[0])
+                self.assertRaises(IndexError, lambda: t.x[[5]])
+                self.assertRaises(IndexError, lambda: t.x[[0, -4]])
+                self.assertRaises(IndexError, lambda: math.expand(t, batch(b=2)).b[[2]])
+
+    def test_unpack_dim_native(self):
+        t = math.wrap(np.arange(72).reshape(2, 12, 3), batch('b'), instance('p'), channel(c='r,g,b'))
+        permuted = NativeTensor(np.arange(72).reshape(3, 12, 2), concat_shapes(channel(c='r,g,b'), instance(p=12), batch(b=2)), concat_shapes(batch(b=2), instance(p=12), channel(c='r,g,b')))
+        expanded = math.expand(math.wrap(np.arange(3), channel(c='r,g,b')), instance(p=12), batch(b=2))
+        for value in [t, permuted, expanded]:
+            for unpacked in [concat_shapes(spatial(x=3), instance(i=4)), concat_shapes(channel(vector='a,b'), spatial(x=6)), concat_shapes(instance(i=4), batch(k=3))]:
+                result = math.unpack_dim(value, 'p', unpacked)
+                generic = Tensor.__unpack_dim__(value, 'p', unpacked)
+                self.assertEqual(generic.shape.names, result.shape.names)
+                self.assertEqual(generic.shape, result.shape)
+                math.assert_close(generic, result)
+        self.assertEqual(('a', 'b'), math.unpack_dim(t, 'p', concat_shapes(channel(vector='a,b'), spatial(x=6))).shape.get_item_names('vector'))
+        self.assertEqual(channel(c='r,g,b'), math.unpack_dim(expanded, 'p', concat_shapes(spatial(x=3), instance(i=4)))._native_shape)  # not expanded
+
+    def test_pack_dims_native(self):
+        t = math.wrap(np.arange(72).reshape(2, 3, 4, 3), batch('b'), spatial('x,y'), channel(c='r,g,b'))
+        permuted = NativeTensor(np.arange(72).reshape(3, 4, 3, 2), concat_shapes(channel(c='r,g,b'), spatial('y,x').with_sizes([4, 3]), batch(b=2)), t.shape)
+        expanded = math.expand(math.wrap(np.arange(3), spatial('x')), batch(b=2), spatial(y=4), channel(c='r,g,b'))
+        for value in [t, permuted, expanded]:
+            dense = math.wrap(value.numpy(value.shape), value.shape)
+            for dims in ['x,y', 'y,x', 'b,y', 'c,x']:
+                for pos in [None, 0, -1]:
+                    result = math.pack_dims(value, dims, instance('p'), pos=pos)
+                    generic = Tensor.__pack_dims__(dense, tuple(dims.split(',')), instance('p'), pos)
+                    self.assertEqual(generic.shape.names, result.shape.names)
+                    self.assertEqual(generic.shape, result.shape)
+                    math.assert_close(generic, result)
+        # p enumerates the packed dims in the given order, independent of pos
+        math.assert_close([3, 39], math.pack_dims(t, 'x,y', instance('p'), pos=0).p[1].c[0])
+        math.assert_close([12, 48], math.pack_dims(t, 'y,x', instance('p'), pos=0).p[1].c[0])
+        self.assertEqual(('r', 'g', 'b'), math.pack_dims(t, 'x,y', instance('p'), pos=0).shape.get_item_names('c'))
+        self.assertEqual(spatial('x').with_sizes([3]), math.pack_dims(expanded, 'b,y', instance('p'))._native_shape)  # not expanded
+
+    def test_tensor_stack_native_cache(self):
+        s = TensorStack([math.zeros(spatial(x=2, y=3)), math.ones(spatial(x=2, y=3))], batch('b'))
+        n = s.native('b,x,y')
+        self.assertIsInstance(s._cached, NativeTensor)  # stacked native is reused by later operations
+        n[0, 0, 0] = 99
+        math.assert_close(0, s.b[0])
+        math.assert_close(0, (s + 0).b[0])
+        self.assertIsNot(n, s.native('b,x,y'))
+
     def test_serialize_tensor(self):
         t = math.random_normal(batch(batch=10), spatial(x=4, y=3), channel(vector=2))
         math.assert_close(t, math.from_dict(math.to_dict(t)))
@@ -675,3 +741,13 @@ class TestTensors(TestCase):
     def test_single_index_gather(self):
         a = tensor([[1, 2, 3], [4, 5, 6]], spatial('y,x'))
         math.assert_close(6, a[vec(y=1, x=2)])
+
+    def test_aligned_operators(self):
+        a = tensor([1., 2, 3], spatial('x'))
+        b = tensor([3., 2, 1], spatial('x'))
+        math.assert_close([-2, 0, 2], a - b)
+        math.assert_close([1/3, 1, 3], a / b)
+        math.assert_close([True, False, False], a < b)
+        math.assert_close([False, True, True], a >= b)
+        math.assert_close([-2, 0, 2], np.subtract(a, b))
+        math.assert_close([False, False, True], np.greater(a, b))
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from unittest import TestCase
 
 from phiml._troubleshoot import assert_minimal_config, troubleshoot, count_tensors_in_memory, plot_solves
@@ -9,7 +11,9 @@ class TestTroubleshoot(TestCase):
         assert_minimal_config()
 
     def test_troubleshoot(self):
-        troubleshoot()
+        report = troubleshoot()
+        self.assertIn("PyTorch: ", str(report))
+        self.assertIsInstance(report.jax, str)
 
     def test_count_tensors_in_memory(self):
         count_tensors_in_memory()
@@ -17,3 +21,8 @@ class TestTroubleshoot(TestCase):
     def test_plot_solves(self):
         with plot_solves():
             math.solve_linear(lambda x: 2 * x, math.tensor(1.), math.Solve(x0=0))
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "solves.png")
+            with plot_solves(filename):
+                math.solve_linear(lambda x: 2 * x, math.tensor(1.), math.Solve(x0=0))
+            self.assertTrue(os.path.isfile(filename))